@@ -14,7 +14,10 @@ Note
 Color camera functionality is not currently implemented, and will lead to undefined behavior.
 """
 
-import time
+import re
+import sys
+import atexit
+import threading
 import numpy as np
 import warnings
 
@@ -22,17 +25,20 @@ from slmsuite.hardware.cameras.camera import Camera
 
 try:
     import vmbpy
+    vimba_module = vmbpy
     vimba_system = vmbpy.VmbSystem
     vimba_name = "vmbpy"
 
 except ImportError:
     try:
         import vimba
+        vimba_module = vimba
         vimba_system = vimba.Vimba
         vimba_name = "vimba"
 
         warnings.warn("vmbpy not installed; falling back to vimba")
     except ImportError:
+        vimba_module = None
         vimba_system = None
         vimba_name = ""
         warnings.warn("vimba or vmbpy are not installed. Install to use AlliedVision cameras.")
@@ -48,6 +54,8 @@ class AlliedVision(Camera):
         AlliedVision SDK. Shared among instances of :class:`AlliedVision`.
     cam : vmbpy.Camera
         Object to talk with the desired camera.
+    buffer_count : int
+        Number of frame buffers announced to the SDK while streaming.
 
     Caution
     ~~~~~~~
@@ -61,11 +69,20 @@ class AlliedVision(Camera):
     :math:`\mathcal{O}(\text{s})` overhead. :class:`.AlliedVision` disables these protections by
     calling :meth:`__enter__()` and :meth:`__exit__()` directly during :meth:`.__init__()` and
     :meth:`.close()`, instead of inside ``with`` statements.
+
+    Note
+    ~~~~
+    The camera is run in ``"Continuous"`` acquisition mode, streaming frames into a
+    small ring of SDK buffers. :meth:`._get_image_hw()` returns the newest valid frame,
+    dropping older ones, such that latency is bounded to roughly one frame period.
     """
 
     sdk = None
+    _atexit_registered = False
+    _close_timer = None
+    _sdk_lock = threading.Lock()
 
-    def __init__(self, serial="", pitch_um=None, verbose=True, **kwargs):
+    def __init__(self, serial="", pitch_um=None, buffer_count=3, verbose=True, **kwargs):
         """
         Initialize camera and attributes.
 
@@ -86,6 +103,8 @@ class AlliedVision(Camera):
         pitch_um : (float, float) OR None
             Fill in extra information about the pixel pitch in ``(dx_um, dy_um)`` form
             to use additional calibrations.
+        buffer_count : int
+            Number of frame buffers to announce to the SDK while streaming.
         verbose : bool
             Whether or not to print extra information.
         **kwargs
@@ -94,90 +113,138 @@ class AlliedVision(Camera):
         if vimba_system is None:
             raise ImportError("vimba or vmbpy are not installed. Install to use AlliedVision cameras.")
 
+        # An SDK left open by info() is adopted as if we had opened it.
+        opened_sdk = AlliedVision._cancel_close_timer() or AlliedVision.sdk is None
         if AlliedVision.sdk is None:
             if verbose:
                 print(f"{vimba_name} initializing... ", end="")
-            AlliedVision.sdk = vimba_system.get_instance()
-            AlliedVision.sdk.__enter__()
+            AlliedVision._open_sdk()
             if verbose:
                 print("success")
 
-        if verbose:
-            print("Looking for cameras... ", end="")
-        camera_list = AlliedVision.sdk.get_all_cameras()
-        if verbose:
-            print("success")
+        # If construction fails partway, release what we opened such that the SDK
+        # does not refuse to reinitialize later in the session.
+        try:
+            if verbose:
+                print("Looking for cameras... ", end="")
+            camera_list = AlliedVision.sdk.get_all_cameras()
+            if verbose:
+                print("success")
 
-        serial_list = [cam.get_serial() for cam in camera_list]
-        if serial == "":
-            if len(camera_list) == 0:
-                raise RuntimeError(f"No cameras found by {vimba_name}.")
-            if len(camera_list) > 1 and verbose:
-                print(f"No serial given... Choosing first of {serial_list}")
+            cams_by_serial = {cam.get_serial(): cam for cam in camera_list}
+            if serial == "":
+                if len(camera_list) == 0:
+                    raise RuntimeError(f"No cameras found by {vimba_name}.")
+                if len(camera_list) > 1 and verbose:
+                    print(f"No serial given... Choosing first of {list(cams_by_serial)}")
 
-            self.cam = camera_list[0]
-            serial = self.cam.get_serial()
-        else:
-            if serial in serial_list:
-                self.cam = camera_list[serial_list.index(serial)]
+                serial, self.cam = next(iter(cams_by_serial.items()))
             else:
-                raise RuntimeError(
-                    f"Serial {serial} not found by {vimba_name}. Available: {serial_list}"
-                )
+                try:
+                    self.cam = cams_by_serial[serial]
+                except KeyError:
+                    raise RuntimeError(
+                        f"Serial {serial} not found by {vimba_name}. Available: {list(cams_by_serial)}"
+                    )
 
-        if verbose:
-            print(f"{vimba_name} sn '{serial}' initializing... ", end="")
-        self.cam.__enter__()
-        if verbose:
-            print("success")
-
-        # Try to set some default properties, with warnings if they fail.
-        try:
-            self.cam.BinningHorizontal.set(1)
-            self.cam.BinningVertical.set(1)
+            if verbose:
+                print(f"{vimba_name} sn '{serial}' initializing... ", end="")
+            self.cam.__enter__()
+            if verbose:
+                print("success")
         except:
-            print("Warning: failed to set binning to 1.")
+            if opened_sdk:
+                AlliedVision.close_sdk()
+            raise
 
         try:
-            self.cam.GainAuto.set("Off")
-        except:
-            print("Warning: failed to turn autogain off.")
+            # Try to set some default properties, with warnings if they fail.
+            try:
+                self.cam.BinningHorizontal.set(1)
+                self.cam.BinningVertical.set(1)
+            except:
+                print("Warning: failed to set binning to 1.")
 
-        try:
-            self.cam.ExposureAuto.set("Off")
-            self.cam.ExposureMode.set("Timed")
-        except:
-            print("Warning: failed to set exposure mode to timed.")
+            try:
+                self.cam.GainAuto.set("Off")
+            except:
+                print("Warning: failed to turn autogain off.")
 
+            try:
+                self.cam.ExposureAuto.set("Off")
+                self.cam.ExposureMode.set("Timed")
+            except:
+                print("Warning: failed to set exposure mode to timed.")
 
-        try:
-            self.cam.AcquisitionMode.set("SingleFrame")
 
-            # Future: triggered instead of SingleFrame.
-            self.cam.TriggerSelector.set("AcquisitionStart")
-            self.cam.TriggerMode.set("Off")
-            self.cam.TriggerActivation.set("RisingEdge")
-            self.cam.TriggerSource.set("Software")
-        except:
-            print("Warning: failed to set acquisition and trigger configuration.")
-
-        # Cache whether the camera has ExposureTimeAbs or ExposureTime, for use
-        # in the get/set exposure methods.
-        if hasattr(self.cam, "ExposureTime"):
-            self._exposure_time_has_abs = False
-        elif hasattr(self.cam, "ExposureTimeAbs"):
-            self._exposure_time_has_abs = True
-        else:
-            self._exposure_time_has_abs = None
+            try:
+                self.cam.AcquisitionMode.set("Continuous")
+
+                self.cam.TriggerSelector.set("AcquisitionStart")
+                self.cam.TriggerMode.set("Off")
+                self.cam.TriggerActivation.set("RisingEdge")
+                self.cam.TriggerSource.set("Software")
+            except:
+                print("Warning: failed to set acquisition and trigger configuration.")
+
+            # Cache whether the camera has ExposureTimeAbs or ExposureTime, for use
+            # in the get/set exposure methods.
+            if hasattr(self.cam, "ExposureTime"):
+                self._exposure_time_has_abs = False
+            elif hasattr(self.cam, "ExposureTimeAbs"):
+                self._exposure_time_has_abs = True
+            else:
+                self._exposure_time_has_abs = None
 
-        # Populate the rest of the class.
-        super().__init__(
-            (self.cam.SensorWidth.get(), self.cam.SensorHeight.get()),
-            bitdepth=int(self.cam.PixelSize.get()),
-            pitch_um=pitch_um,
-            name=serial,
-            **kwargs,
-        )
+            # Parsed lazily by get_adc_bitdepth().
+            self._adc_bitdepth_cache = None
+
+            # Map each supported ADC bitdepth to its SensorBitDepth enum value.
+            # Entries without a bitdepth in their name (e.g. Adaptive) are skipped.
+            try:
+                entries = self.cam.SensorBitDepth.get_all_entries()
+            except:
+                entries = []
+
+            self._bitdepth_map = {}
+            for entry in entries:
+                name, value = entry.as_tuple()
+                match = re.search(r"\d+", name)
+                if match is not None:
+                    self._bitdepth_map[int(match.group())] = value
+
+            # Cache the frame layout such that SDK buffers can be viewed directly,
+            # and the sensor limits such that no SDK getters are needed afterward.
+            bitdepth = int(self.cam.PixelSize.get())
+            self._frame_shape = (int(self.cam.Height.get()), int(self.cam.Width.get()))
+            self._frame_dtype = np.dtype(np.uint16 if bitdepth > 8 else np.uint8)
+            self._woi_max = (0, int(self.cam.WidthMax.get()), 0, int(self.cam.HeightMax.get()))
+            sensor_resolution = (int(self.cam.SensorWidth.get()), int(self.cam.SensorHeight.get()))
+
+            # Start streaming into a small ring of buffers. The frame handler holds
+            # only the newest valid frame.
+            self.buffer_count = int(buffer_count)
+            self._latest = None
+            self._frame_cv = threading.Condition()
+            self._streaming = False
+            self._start_streaming()
+
+            # Populate the rest of the class.
+            super().__init__(
+                sensor_resolution,
+                bitdepth=bitdepth,
+                pitch_um=pitch_um,
+                name=serial,
+                **kwargs,
+            )
+        except:
+            if getattr(self, "_streaming", False):
+                self._stop_streaming()
+            self.cam.__exit__(None, None, None)
+            del self.cam
+            if opened_sdk:
+                AlliedVision.close_sdk()
+            raise
 
     def close(self, close_sdk=True):
         """
@@ -188,6 +255,7 @@ class AlliedVision(Camera):
         close_sdk : bool
             Whether or not to close the :mod:`vmbpy` instance.
         """
+        self._stop_streaming()
         self.cam.__exit__(None, None, None)
 
         if close_sdk:
@@ -196,7 +264,7 @@ class AlliedVision(Camera):
         del self.cam
 
     @staticmethod
-    def info(verbose=True):
+    def info(verbose=True, keep_open_s=5):
         """
         Discovers all AlliedVision cameras.
 
@@ -204,6 +272,11 @@ class AlliedVision(Camera):
         ----------
         verbose : bool
             Whether to print the discovered information.
+        keep_open_s : float
+            If the :mod:`vmbpy` instance was not already open, it is kept open for this
+            grace period in seconds before closing, such that an :class:`AlliedVision`
+            constructed shortly afterward does not pay to reopen it.
+            If ``0``, the instance is closed immediately.
 
         Returns
         --------
@@ -213,15 +286,15 @@ class AlliedVision(Camera):
         if vimba_system is None:
             raise ImportError("vimba or vmbpy are not installed. Install to use AlliedVision cameras.")
 
-        if AlliedVision.sdk is None:
-            AlliedVision.sdk = vimba_system.get_instance()
-            AlliedVision.sdk.__enter__()
+        if AlliedVision._cancel_close_timer() or AlliedVision.sdk is None:
+            if AlliedVision.sdk is None:
+                AlliedVision._open_sdk()
             close_sdk = True
         else:
             close_sdk = False
 
-        camera_list = AlliedVision.sdk.get_all_cameras()
-        serial_list = [cam.get_serial() for cam in camera_list]
+        cams_by_serial = {cam.get_serial(): cam for cam in AlliedVision.sdk.get_all_cameras()}
+        serial_list = list(cams_by_serial)
 
         if verbose:
             print(f"{vimba_name} serials:")
@@ -229,10 +302,55 @@ class AlliedVision(Camera):
                 print(f"'{serial}'")
 
         if close_sdk:
-            AlliedVision.close_sdk()
+            if keep_open_s > 0:
+                with AlliedVision._sdk_lock:
+                    timer = threading.Timer(keep_open_s, AlliedVision._close_sdk_deferred)
+                    timer.daemon = True
+                    AlliedVision._close_timer = timer
+                    timer.start()
+            else:
+                AlliedVision.close_sdk()
 
         return serial_list
 
+    @classmethod
+    def _cancel_close_timer(cls):
+        """
+        Cancel a pending deferred close from :meth:`info()`.
+
+        Returns
+        -------
+        bool
+            Whether a deferred close was pending.
+        """
+        with cls._sdk_lock:
+            timer = cls._close_timer
+            cls._close_timer = None
+        if timer is None:
+            return False
+        timer.cancel()
+        return True
+
+    @classmethod
+    def _close_sdk_deferred(cls):
+        """Close the :mod:`vmbpy` instance, unless the deferred close was cancelled."""
+        with cls._sdk_lock:
+            if cls._close_timer is threading.current_thread():
+                cls._close_timer = None
+                cls.close_sdk()
+
+    @classmethod
+    def _open_sdk(cls):
+        """
+        Open the :mod:`vmbpy` instance, making sure it is closed at interpreter exit.
+        """
+        cls.sdk = vimba_system.get_instance()
+        cls.sdk.__enter__()
+
+        if not cls._atexit_registered:
+            atexit.register(cls.close_sdk)
+            cls._atexit_registered = True
+
     @classmethod
     def close_sdk(cls):
         """
@@ -242,6 +360,88 @@ class AlliedVision(Camera):
             cls.sdk.__exit__(None, None, None)
             cls.sdk = None
 
+    ### Streaming ###
+
+    def _start_streaming(self):
+        """Begin continuous acquisition, feeding frames to :meth:`._on_frame()`."""
+        if not self._streaming:
+            self._latest = None
+
+            # Let the transport layer allocate the buffers it can DMA into directly,
+            # falling back to buffers allocated by the SDK if this is not supported.
+            try:
+                self.cam.start_streaming(
+                    handler=self._on_frame,
+                    buffer_count=self.buffer_count,
+                    allocation_mode=vimba_module.AllocationMode.AllocAndAnnounceFrame,
+                )
+            except Exception:
+                self.cam.start_streaming(
+                    handler=self._on_frame,
+                    buffer_count=self.buffer_count,
+                    allocation_mode=vimba_module.AllocationMode.AnnounceFrame,
+                )
+            self._streaming = True
+
+    def _stop_streaming(self):
+        """End continuous acquisition, if active."""
+        if self._streaming:
+            self.cam.stop_streaming()
+            self._streaming = False
+            with self._frame_cv:
+                self._latest = None
+
+    def _on_frame(self, cam, *args):
+        """
+        Frame handler called by the SDK from its own thread.
+        :mod:`vmbpy` passes ``(cam, stream, frame)`` while :mod:`vimba` passes
+        ``(cam, frame)``, so the frame is always the last argument.
+
+        Valid frames are not copied: the frame itself is held until it is either
+        consumed by :meth:`._get_image_hw()` or replaced by a newer frame, at which
+        point its buffer is returned to the SDK.
+        """
+        frame = args[-1]
+
+        if frame.get_status() == vimba_module.FrameStatus.Complete:
+            # View the SDK buffer directly; the buffer may be padded beyond the image.
+            image = np.frombuffer(
+                frame.get_buffer(),
+                dtype=self._frame_dtype,
+                count=self._frame_shape[0] * self._frame_shape[1],
+            ).reshape(self._frame_shape)
+
+            # We have noticed that sometimes the camera gets into a state where
+            # it returns a frame of all zeros apart from one pixel with value of 31.
+            # Such frames are simply not enqueued.
+            if not self._is_dead_frame(image):
+                # Swap the new frame into the single slot under a short lock, such that
+                # the SDK thread never waits on the consumer. The stale frame (if any)
+                # is returned to the SDK outside the lock.
+                with self._frame_cv:
+                    stale = self._latest
+                    self._latest = (frame, image)
+                    self._frame_cv.notify()
+                if stale is not None:
+                    cam.queue_frame(stale[0])
+                return
+
+        cam.queue_frame(frame)
+
+    @staticmethod
+    def _is_dead_frame(image):
+        """
+        Whether ``image`` is all zeros apart from a single pixel of value 31.
+        A strided sample of ~64 pixels rules out nearly all valid frames before
+        any full pass over the image is made.
+        """
+        sample = image.ravel()[::max(1, image.size // 64)]
+        if sample.max() > 31 or np.count_nonzero(sample) > 1:
+            return False
+
+        # Checking the maximum first short-circuits the sum for most remaining frames.
+        return image.max() == 31 and image.sum() == 31
+
     ### Property Configuration ###
 
     def get_properties(self, properties=None):
@@ -253,32 +453,40 @@ class AlliedVision(Camera):
         properties : dict or None
             The target camera's property dictionary. If ``None``, the property
             dictionary is fetched from the camera associated with the calling instance.
+
+        Returns
+        -------
+        list of tuple
+            ``(name, value, unit, description)`` strings for each property, with
+            empty strings for fields that could not be read.
         """
+        camera_properties = vars(self.cam)
         if properties is None:
-            properties = self.cam.__dict__.keys()
+            properties = camera_properties.keys()
 
+        rows = []
+        lines = []
         for key in properties:
-            prop = self.cam.__dict__[key]
+            prop = camera_properties[key]
             try:
-                print(prop.get_name(), end="\t")
+                row = [str(prop.get_name())]
             except BaseException as e:
-                print(f"Error accessing property dictionary, '{key}':{e}")
+                lines.append(f"Error accessing property dictionary, '{key}':{e}")
                 continue
 
-            try:
-                print(prop.get(), end="\t")
-            except:
-                pass
+            for getter in ("get", "get_unit", "get_description"):
+                try:
+                    row.append(str(getattr(prop, getter)()))
+                except:
+                    row.append("")
 
-            try:
-                print(prop.get_unit(), end="\t")
-            except:
-                pass
+            rows.append(tuple(row))
+            lines.append("\t".join(row))
 
-            try:
-                print(prop.get_description(), end="\n")
-            except:
-                print("")
+        # Write everything at once rather than paying for a print per field.
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        return rows
 
     def set_adc_bitdepth(self, bitdepth):
         """
@@ -291,12 +499,15 @@ class AlliedVision(Camera):
         """
         bitdepth = int(bitdepth)
 
-        for entry in self.cam.SensorBitDepth.get_all_entries():
-            value = entry.as_tuple()  # (name : str, value : int)
-            if str(bitdepth) in value[0]:
-                self.cam.SensorBitDepth.set(value[1])
-                break
-            raise RuntimeError(f"ADC bitdepth {bitdepth} not found.")
+        try:
+            value = self._bitdepth_map[bitdepth]
+        except KeyError:
+            raise RuntimeError(
+                f"ADC bitdepth {bitdepth} not found. Available: {list(self._bitdepth_map)}"
+            )
+
+        self.cam.SensorBitDepth.set(value)
+        self._adc_bitdepth_cache = bitdepth
 
     def get_adc_bitdepth(self):
         """
@@ -307,9 +518,10 @@ class AlliedVision(Camera):
         int
             The digitization bitdepth.
         """
-        value = str(self.cam.SensorBitDepth.get())
-        bitdepth = int("".join(char for char in value if char.isdigit()))
-        return bitdepth
+        if self._adc_bitdepth_cache is None:
+            value = str(self.cam.SensorBitDepth.get())
+            self._adc_bitdepth_cache = int(re.search(r"\d+", value).group())
+        return self._adc_bitdepth_cache
 
     def _get_exposure_hw(self):
         """See :meth:`.Camera._get_exposure_hw`."""
@@ -349,15 +561,20 @@ class AlliedVision(Camera):
         self.cam.OffsetY.set(y)
         self.cam.Height.set(h)
         self.cam.Width.set(w)
+        self._frame_shape = (h, w)
 
     def set_woi(self, woi=None):
         """See :meth:`.Camera.set_woi`."""
-        maxwoi = (0, self.cam.WidthMax.get(), 0, self.cam.HeightMax.get())
+        maxwoi = self._woi_max
 
         # Default WOI to max.
         if woi is None:
             woi = maxwoi
 
+        # The frame size cannot be changed while streaming.
+        streaming = self._streaming
+        self._stop_streaming()
+
         try:
             # Try to set the WOI.
             self._set_woi(woi)
@@ -367,22 +584,21 @@ class AlliedVision(Camera):
             woi = self.woi if self.woi is not None else maxwoi
             self._set_woi(woi)
             raise e
+        finally:
+            if streaming:
+                self._start_streaming()
 
 
     def _get_image_hw(self, timeout_s):
         """See :meth:`.Camera._get_image_hw`."""
-        t = time.time()
-
-        # Convert timeout_s to ms
-        frame = self.cam.get_frame(timeout_ms=int(1e3 * timeout_s))
-        frame = frame.as_numpy_ndarray()
-
-        # We have noticed that sometimes the camera gets into a state where
-        # it returns a frame of all zeros apart from one pixel with value of 31.
-        # This method is admittedly a hack to try getting a frame a few more times.
-        # We welcome contributions to fix this.
-        while np.sum(frame) == np.amax(frame) == 31 and time.time() - t < timeout_s:
-            frame = self.cam.get_frame(timeout_ms=int(1e3 * timeout_s))
-            frame = frame.as_numpy_ndarray()
-
-        return np.squeeze(frame)
+        # Take the newest valid frame, waiting for one if none has arrived yet.
+        with self._frame_cv:
+            if not self._frame_cv.wait_for(lambda: self._latest is not None, timeout=timeout_s):
+                raise RuntimeError(f"Timed out after {timeout_s} s waiting for a frame.")
+            frame, image = self._latest
+            self._latest = None
+
+        # The single copy out of the SDK buffer, which is then handed back.
+        image = image.copy()
+        self.cam.queue_frame(frame)
+        return image
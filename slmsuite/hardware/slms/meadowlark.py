@@ -16,7 +16,9 @@ When multiple SDKs are installed, the most recent SDK is chosen by default.
 To choose otherwise, pass the path to the desired SDK.
 """
 import os
+import glob
 import ctypes
+import functools
 import warnings
 from enum import IntEnum
 from pathlib import Path
@@ -68,6 +70,76 @@ _SLM_LIB_TRACES = {
     _SDK_MODE.PCIE_LEGACY: [(8, 8)],
 }
 
+_UBYTE_P = ctypes.POINTER(ctypes.c_ubyte)
+
+# Write_image signatures, keyed by (_SDK_MODE, number of Write_image arguments).
+_WRITE_IMAGE_ARGTYPES = {
+    (_SDK_MODE.HDMI, 2): [_UBYTE_P, ctypes.c_uint],
+    (_SDK_MODE.HDMI, 3): [ctypes.c_uint, _UBYTE_P, ctypes.c_uint],
+    (_SDK_MODE.PCIE_MODERN_3, 3): [ctypes.c_uint, _UBYTE_P, ctypes.c_uint],
+    (_SDK_MODE.PCIE_MODERN_6, 6): [
+        ctypes.c_uint, _UBYTE_P, ctypes.c_bool, ctypes.c_bool, ctypes.c_bool, ctypes.c_uint
+    ],
+    (_SDK_MODE.PCIE_MODERN_8, 8): [
+        ctypes.c_uint, _UBYTE_P, ctypes.c_uint,
+        ctypes.c_bool, ctypes.c_bool, ctypes.c_bool, ctypes.c_bool, ctypes.c_uint
+    ],
+    (_SDK_MODE.PCIE_LEGACY, 8): [
+        ctypes.c_uint, _UBYTE_P, ctypes.c_uint,
+        ctypes.c_bool, ctypes.c_bool, ctypes.c_bool, ctypes.c_bool, ctypes.c_uint
+    ],
+}
+
+# Signatures of the SDK functions other than Write_image, as name : (argtypes, restype).
+# Functions which are absent from a given SDK version are skipped.
+_PCIE_SIGNATURES = {
+    "Read_Serial_Number": ([ctypes.c_int], ctypes.c_int),
+    "Get_image_width": ([ctypes.c_int], ctypes.c_int),
+    "Get_image_height": ([ctypes.c_int], ctypes.c_int),
+    "Get_image_depth": ([ctypes.c_int], ctypes.c_int),
+    "Get_pitch": ([ctypes.c_int], ctypes.c_double),
+    "Get_cover_voltage": ([ctypes.c_int], ctypes.c_double),
+    "Get_last_error_message": ([], ctypes.c_char_p),
+    "Get_version_info": ([], ctypes.c_char_p),
+    "Load_LUT_file": ([ctypes.c_int, ctypes.c_char_p], ctypes.c_int),
+    "ImageWriteComplete": ([ctypes.c_uint, ctypes.c_uint], ctypes.c_int),
+    "Delete_SDK": ([], ctypes.c_int),
+}
+
+_SDK_SIGNATURES = {
+    _SDK_MODE.NULL: {},
+    _SDK_MODE.HDMI: {
+        "Load_lut": ([ctypes.c_char_p], ctypes.c_int),
+        "Get_Width": ([], ctypes.c_int),
+        "Get_Height": ([], ctypes.c_int),
+        "Get_Depth": ([], ctypes.c_int),
+        "Get_SLMTemp": ([], ctypes.c_double),
+        "Get_SLMVCom": ([], ctypes.c_double),
+        "Get_version_info": ([], ctypes.c_char_p),
+        "Delete_SDK": ([], ctypes.c_int),
+    },
+    _SDK_MODE.PCIE_MODERN_3: {
+        **_PCIE_SIGNATURES,
+        "Read_SLM_temperature": ([ctypes.c_int], ctypes.c_double),
+        "SetWaitForTrigger": ([ctypes.c_uint, ctypes.c_bool], ctypes.c_int),
+        "SetFlipImmediate": ([ctypes.c_uint, ctypes.c_bool], ctypes.c_int),
+        "SetOutputPulse": ([ctypes.c_uint, ctypes.c_bool], ctypes.c_int),
+    },
+    _SDK_MODE.PCIE_MODERN_6: {
+        **_PCIE_SIGNATURES,
+        "Get_SLMTemp": ([ctypes.c_int], ctypes.c_double),
+    },
+    _SDK_MODE.PCIE_MODERN_8: {
+        **_PCIE_SIGNATURES,
+        "Get_SLMTemp": ([ctypes.c_int], ctypes.c_double),
+    },
+    _SDK_MODE.PCIE_LEGACY: {
+        **_PCIE_SIGNATURES,
+        "Set_true_frames": ([ctypes.c_int], ctypes.c_int),
+        "SLM_power": ([ctypes.c_bool], ctypes.c_int),
+    },
+}
+
 class Meadowlark(SLM):
     """
     Interfaces with Meadowlark SLMs.
@@ -85,6 +157,7 @@ class Meadowlark(SLM):
     _slm_lib_trace = {}     # _SDK_Mode : (int, int)    # See documentation for _SLM_LIB_TRACES
     _sdk_path = {}          # _SDK_Mode : str
     _number_of_boards = {}  # _SDK_Mode : int
+    _dll_directory = {}     # _SDK_Mode : handle from os.add_dll_directory
 
     def __init__(  # noqa: R0913, R0917
         self,
@@ -225,6 +298,15 @@ class Meadowlark(SLM):
                 stacklevel=2,
             )
 
+        # Cache the ctypes arguments for Write_image such that no ctypes objects are
+        # constructed per frame. The pointer targets self.display, which set_phase()
+        # fills in place.
+        self._frame_buf = np.ascontiguousarray(self.display, dtype=self.dtype)
+        self.display = self._frame_buf
+        self._frame_ptr = self._frame_buf.ctypes.data_as(_UBYTE_P)
+        self._slm_number_c = ctypes.c_uint(self.slm_number)
+        self._is_8bit = ctypes.c_uint(self.bitdepth == 8)
+
         self.set_phase(None)
 
     def close(self) -> None:
@@ -421,7 +503,6 @@ class Meadowlark(SLM):
         sdk = Meadowlark._slm_lib[sdk_mode]
         try:
             if sdk_mode.is_pcie:
-                sdk.Get_pitch.restype = ctypes.c_double
                 pitch = sdk.Get_pitch(ctypes.c_int(slm_number))
                 return pitch, pitch
             else:
@@ -447,7 +528,6 @@ class Meadowlark(SLM):
             If the error message retrieval is not supported for the SLM.
         """
         if self.sdk_mode.is_pcie:
-            Meadowlark._slm_lib[self.sdk_mode].Get_last_error_message.restype = ctypes.c_char_p
             return Meadowlark._slm_lib[self.sdk_mode].Get_last_error_message().decode("utf-8")
         else:
             raise NotImplementedError(
@@ -464,7 +544,6 @@ class Meadowlark(SLM):
             Version information.
         """
         sdk = Meadowlark._slm_lib[self.sdk_mode]
-        sdk.Get_version_info.restype = ctypes.c_char_p
         return sdk.Get_version_info().decode("utf-8")
 
     def get_temperature(self) -> float:
@@ -483,16 +562,13 @@ class Meadowlark(SLM):
         """
         sdk = Meadowlark._slm_lib[self.sdk_mode]
         if self.sdk_mode == _SDK_MODE.HDMI:
-            sdk.Get_SLMTemp.restype = ctypes.c_double
             return float(sdk.Get_SLMTemp())
         elif self.sdk_mode == _SDK_MODE.PCIE_MODERN_3:
-            sdk.Read_SLM_temperature.restype = ctypes.c_double
             return float(sdk.Read_SLM_temperature(ctypes.c_int(self.slm_number)))
         elif self.sdk_mode in {
             _SDK_MODE.PCIE_MODERN_6,
             _SDK_MODE.PCIE_MODERN_8,
         }:
-            sdk.Get_SLMTemp.restype = ctypes.c_double
             return float(sdk.Get_SLMTemp(ctypes.c_int(self.slm_number)))
         else:
             raise NotImplementedError(
@@ -515,14 +591,12 @@ class Meadowlark(SLM):
         """
         sdk = Meadowlark._slm_lib[self.sdk_mode]
         if self.sdk_mode == _SDK_MODE.HDMI:
-            sdk.Get_SLMVCom.restype = ctypes.c_double
             return float(sdk.Get_SLMVCom())
         elif self.sdk_mode in {
             _SDK_MODE.PCIE_MODERN_3,
             _SDK_MODE.PCIE_MODERN_6,
             _SDK_MODE.PCIE_MODERN_8,
         }:
-            sdk.Get_cover_voltage.restype = ctypes.c_double
             return float(sdk.Get_cover_voltage(ctypes.c_int(self.slm_number)))
         else:
             raise NotImplementedError(
@@ -604,6 +678,43 @@ class Meadowlark(SLM):
             raise RuntimeError("Failed to change output trigger on SLM due to unknown SDK mode")
 
     # Main write function
+    def get_phase_buffer(self) -> np.ndarray:
+        """
+        Get the persistent, contiguous integer buffer whose pointer is passed to the SDK.
+        Integer data can be rendered directly into this buffer and displayed with
+        :meth:`flush_phase_buffer()`, skipping the error-checking and staging copy
+        of :meth:`.SLM.set_phase`:
+
+        .. code-block:: python
+
+            slm.get_phase_buffer()[:] = display
+            slm.flush_phase_buffer()
+
+        Caution
+        ~~~~~~~
+        The data is not checked against the bitdepth, and
+        :attr:`~slmsuite.hardware.slms.slm.SLM.phase` is not updated.
+
+        Returns
+        -------
+        numpy.ndarray
+            The buffer, of shape :attr:`~slmsuite.hardware.slms.slm.SLM.shape` and
+            type :attr:`~slmsuite.hardware.slms.slm.SLM.dtype`.
+        """
+        return self._frame_buf
+
+    def flush_phase_buffer(self, **kwargs) -> None:
+        """
+        Display the contents of :meth:`get_phase_buffer()` on the SLM.
+
+        Parameters
+        ----------
+        **kwargs
+            Passed to :meth:`_set_phase_hw()`.
+        """
+        self.display = self._frame_buf
+        self._set_phase_hw(self._frame_buf, **kwargs)
+
     def _set_phase_hw(
             self,
             display: np.ndarray,
@@ -628,18 +739,22 @@ class Meadowlark(SLM):
         timeout_s : float
             Timeout for SLM trigger.
         """
-        slm_number = ctypes.c_uint(self.slm_number)
+        # Copy into the persistent buffer if we were not handed it directly.
+        if display is not self._frame_buf:
+            np.copyto(self._frame_buf, display, casting="unsafe")
+
+        slm_number = self._slm_number_c
         if self.sdk_mode == _SDK_MODE.HDMI:
             if Meadowlark._slm_lib_trace[_SDK_MODE.HDMI][1] == 2:       # 2 arguments
                 Meadowlark._slm_lib[self.sdk_mode].Write_image(
-                    display.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
-                    ctypes.c_uint(self.bitdepth == 8),  # Is 8-bit
+                    self._frame_ptr,
+                    self._is_8bit,
                 )
             elif Meadowlark._slm_lib_trace[_SDK_MODE.HDMI][1] == 3:     # 3 arguments
                 Meadowlark._slm_lib[self.sdk_mode].Write_image(
                     slm_number,
-                    display.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
-                    ctypes.c_uint(self.bitdepth == 8),  # Is 8-bit
+                    self._frame_ptr,
+                    self._is_8bit,
                 )
         elif self.sdk_mode.is_pcie:
             wait_for_trigger = ctypes.c_bool(self._wait_for_trigger)
@@ -657,13 +772,13 @@ class Meadowlark(SLM):
                 if self.sdk_mode == _SDK_MODE.PCIE_MODERN_3:
                     status = Meadowlark._slm_lib[self.sdk_mode].Write_image(
                         slm_number,
-                        display.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+                        self._frame_ptr,
                         trigger_timeout,
                     )
                 elif self.sdk_mode == _SDK_MODE.PCIE_MODERN_6:
                     status = Meadowlark._slm_lib[self.sdk_mode].Write_image(
                         slm_number,
-                        display.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+                        self._frame_ptr,
                         wait_for_trigger,
                         flip_immediate,
                         output_pulse_image_flip,
@@ -672,7 +787,7 @@ class Meadowlark(SLM):
                 elif self.sdk_mode in {_SDK_MODE.PCIE_MODERN_8, _SDK_MODE.PCIE_LEGACY}:
                     status = Meadowlark._slm_lib[self.sdk_mode].Write_image(
                         slm_number,
-                        display.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+                        self._frame_ptr,
                         ctypes.c_uint(self.shape[0] * self.shape[1]),
                         wait_for_trigger,
                         flip_immediate,
@@ -724,14 +839,7 @@ class Meadowlark(SLM):
 
         # Locate the Meadowlark SDK. If there are multiple, default to the
         # most recent one.
-        files = list(Path(sdk_path).rglob("*Blink_C_Wrapper*dll"))
-        files.sort(key=os.path.getmtime, reverse=True)
-        cases = []
-        for file in files:
-            if not ("Cal Kit" in str(file)):
-                mode, dll_path, trace = Meadowlark._parse_header(file.parents[0], warn=True)
-                if mode:
-                    cases.append((mode, dll_path, trace))
+        cases = Meadowlark._find_sdks(sdk_path)
 
         if len(cases) == 0:
             raise FileNotFoundError(
@@ -762,9 +870,16 @@ class Meadowlark(SLM):
                 f"Other options:\n{options}"
             )
 
-        # First load the .dll
+        # First load the .dll by its absolute path. On Windows, also register the SDK
+        # folder such that the wrapper's dependencies resolve without probing PATH.
+        if hasattr(os, "add_dll_directory") and mode not in Meadowlark._dll_directory:
+            Meadowlark._dll_directory[mode] = os.add_dll_directory(
+                os.path.dirname(os.path.abspath(dll_path))
+            )
         try:
-            Meadowlark._slm_lib[mode] = ctypes.CDLL(dll_path, mode=ctypes.RTLD_LOCAL)
+            Meadowlark._slm_lib[mode] = ctypes.CDLL(
+                os.path.abspath(dll_path), mode=ctypes.RTLD_LOCAL
+            )
             Meadowlark._slm_lib_trace[mode] = trace
             Meadowlark._sdk_path[mode] = dll_path
             Meadowlark._number_of_boards[mode] = 1
@@ -774,6 +889,19 @@ class Meadowlark(SLM):
                 f"Is '{dll_path}' the correct path?"
             ) from exc
 
+        # Declare the function signatures once such that ctypes does not infer the
+        # argument conversions on every call.
+        Meadowlark._slm_lib[mode].Write_image.argtypes = _WRITE_IMAGE_ARGTYPES[(mode, trace[1])]
+        Meadowlark._slm_lib[mode].Write_image.restype = ctypes.c_int
+
+        for name, (argtypes, restype) in _SDK_SIGNATURES[mode].items():
+            try:
+                function = getattr(Meadowlark._slm_lib[mode], name)
+            except AttributeError:
+                continue
+            function.argtypes = argtypes
+            function.restype = restype
+
         try:
             if mode == _SDK_MODE.HDMI:
                 if trace[0] == 0:
@@ -841,6 +969,37 @@ class Meadowlark(SLM):
 
         return mode
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _find_sdks(sdk_path: str) -> Tuple[Tuple[_SDK_MODE, str, Tuple[int, int]], ...]:
+        """
+        Recursively searches ``sdk_path`` for valid Meadowlark SDKs. The search is
+        cached per ``sdk_path`` such that the file tree is only walked once per process.
+
+        Parameters
+        ----------
+        sdk_path : str
+            Path to search for the Meadowlark SDK.
+
+        Returns
+        -------
+        tuple
+            ``(mode, dll_path, trace)`` for each valid SDK, most recent first.
+        """
+        files = glob.iglob(os.path.join(sdk_path, "**", "*Blink_C_Wrapper*dll"), recursive=True)
+        files = sorted(
+            ((os.path.getmtime(file), file) for file in files if not "Cal Kit" in file),
+            reverse=True,
+        )
+
+        cases = []
+        for _, file in files:
+            mode, dll_path, trace = Meadowlark._parse_header(os.path.dirname(file), warn=True)
+            if mode:
+                cases.append((mode, dll_path, trace))
+
+        return tuple(cases)
+
     @staticmethod
     def _parse_header(file: str, warn: bool = False) -> Tuple[_SDK_MODE, str, Tuple[int, int]]:
         """Checks if a path has an appropriate header"""
@@ -948,13 +1107,15 @@ class Meadowlark(SLM):
         if not os.path.exists(lut_path):
             raise FileNotFoundError(f"Failed to locate LUT at: '{lut_path}'")
 
-        # Finally, actually load the LUT file
+        # Finally, actually load the LUT file. The SDK expects a char*, so encode once.
+        lut_path = str(lut_path)
+        lut_path_c = lut_path.encode("utf-8")
         try:
             if self.sdk_mode == _SDK_MODE.HDMI:
-                Meadowlark._slm_lib[self.sdk_mode].Load_lut(lut_path)
+                Meadowlark._slm_lib[self.sdk_mode].Load_lut(lut_path_c)
             elif self.sdk_mode.is_pcie:
                 success = Meadowlark._slm_lib[self.sdk_mode].Load_LUT_file(
-                    ctypes.c_int(self.slm_number), lut_path.encode("utf-8")
+                    ctypes.c_int(self.slm_number), lut_path_c
                 )
                 if success != 1:
                     warnings.warn(f"Failed to load LUT file: '{lut_path}'")
@@ -970,9 +1131,9 @@ class Meadowlark(SLM):
         search_path: Union[str, Path], slm_shape: Optional[Tuple[int, int]] = None
     ) -> str:
         """
-        Locates the LUT file in the given path. If there are multiple, returns the
-        most recent file.. If there are none with ".slm" in the
-        name, simply returns the most recent ".lut" file.
+        Locates the LUT file in the given path. If there are multiple, prefers files
+        matching the SLM dimensions, then files prefixed with ``"slm"`` (as Meadowlark
+        names LUTs customized to an SLM), and finally returns the most recent file.
 
         Parameters
         ----------
@@ -991,21 +1152,43 @@ class Meadowlark(SLM):
         FileNotFoundError
             If no .lut files are found in provided path.
         """
-        files = {file for file in Path(search_path).rglob("*.lut")}
+        # os.walk is backed by os.scandir, so no extra stat calls are made per entry.
+        # The extension is matched case-insensitively, unlike Path.rglob on Linux.
+        files = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(search_path)
+            for name in names
+            if name.lower().endswith(".lut")
+        )
 
         if len(files) == 1:
-            return str(files.pop())
+            return files[0]
         elif len(files) > 1:
             # REVIEW: If there are multiple LUTs, first check if only one matches the
             #  current slm's dimensions (if possible).
             if slm_shape:
-                files = {
+                matches = [
                     file
                     for file in files
-                    if (f"{slm_shape[1]}" in file.stem and f"{slm_shape[0]}" in file.stem)
-                }
-                if len(files) == 1:
-                    return str(files.pop())
+                    if (
+                        f"{slm_shape[1]}" in os.path.basename(file)[:-4]
+                        and f"{slm_shape[0]}" in os.path.basename(file)[:-4]
+                    )
+                ]
+                if len(matches) == 1:
+                    return matches[0]
+                elif len(matches) > 1:
+                    files = matches
+
+            # Then prefer the LUTs that Meadowlark customized to an SLM.
+            slm_files = [
+                file for file in files if os.path.basename(file).lower().startswith("slm")
+            ]
+            if len(slm_files) == 1:
+                return slm_files[0]
+            elif len(slm_files) > 1:
+                files = slm_files
+
             # If there are still multiple LUTs, default to the most recent one.
             lut_path_ = max(files, key=os.path.getctime)
             warnings.warn(
@@ -1013,6 +1196,6 @@ class Meadowlark(SLM):
                 f"{lut_path_}.",
                 stacklevel=3,
             )
-            return str(lut_path_)
+            return lut_path_
         else:
             raise FileNotFoundError(f"No .lut file found in '{search_path}'.")
@@ -322,7 +322,56 @@ extern "C" __global__ void zernike_test(
     }
 }
 
-// Polynomial sum kernel
+// Polynomial sum kernels
+
+extern "C" __device__ __forceinline__ float polynomial_pixel(
+    const int N,                    // Number of coefficients
+    const float* coefficients,      // Monomial coefficients (1*N)
+    const short* pxy,               // Monomial exponents (2*N)
+    const float x,                  // X coordinate of this pixel
+    const float y                   // Y coordinate of this pixel
+) {
+    // Make a local result variable to avoid talking with global memory.
+    float result = 0;
+
+    // Local helper variables.
+    float coefficient;
+    float monomial = 1;
+    int i, j, nx, ny, nx0 = 0, ny0 = 0;
+
+    // Loop over all the spots (compiler should handle optimizing the trinary).
+    for (i = 0; i < N; i++) {
+        coefficient = coefficients[i];
+
+        if (coefficient != 0) {
+            nx = pxy[i];
+            ny = pxy[i+N];
+
+            // Reset if we're starting a new path.
+            if (nx - nx0 < 0 || ny - ny0 < 0) {
+                nx0 = ny0 = 0;
+                monomial = 1;
+            }
+
+            // Traverse the path in +x or +y.
+            for (j = 0; j < nx - nx0; j++) {
+                monomial *= x;
+            }
+            for (j = 0; j < ny - ny0; j++) {
+                monomial *= y;
+            }
+
+            // Add the monomial to the result.
+            result += coefficients[i] * monomial;
+
+            // Update the state of the monomial
+            nx0 = nx;
+            ny0 = ny;
+        }
+    }
+
+    return result;
+}
 
 extern "C" __global__ void polynomial(
     const int WH,                   // Size of nearfield
@@ -337,50 +386,72 @@ extern "C" __global__ void polynomial(
     int g = blockDim.x * blockIdx.x + threadIdx.x;
 
     if (g < WH) {
-        // Make a local result variable to avoid talking with global memory.
+        out[g] = polynomial_pixel(N, coefficients, pxy, X[g], Y[g]);
+    }
+}
+
+extern "C" __global__ void polynomial_masked(
+    const int WH,                   // Size of nearfield
+    const int N,                    // Number of coefficients
+    const float* coefficients,      // Monomial coefficients (1*N)
+    const short* pxy,               // Monomial exponents (2*N)
+    const float* X,                 // X grid (WH)
+    const float* Y,                 // Y grid (WH)
+    const bool* mask,               // Pixels to compute (WH)
+    const float mask_value,         // Value of the other pixels
+    float* out                      // Output (WH)
+) {
+    // g is each pixel in the grid.
+    int g = blockDim.x * blockIdx.x + threadIdx.x;
+
+    if (g < WH) {
+        if (mask[g]) {
+            out[g] = polynomial_pixel(N, coefficients, pxy, X[g], Y[g]);
+        } else {
+            out[g] = mask_value;
+        }
+    }
+}
+
+// Laguerre-Gaussian kernel
+
+extern "C" __global__ void laguerre_gaussian(
+    const int WH,                   // Size of nearfield
+    const int D,                    // Number of Laguerre coefficients (0 if p = 0)
+    const float* coefficients,      // Laguerre coefficients in increasing power (D)
+    const float l,                  // Azimuthal wavenumber
+    const float scale,              // Factor applied to the squared radius
+    const float* X,                 // X grid (WH)
+    const float* Y,                 // Y grid (WH)
+    float* out                      // Output (WH)
+) {
+    // g is each pixel in the grid.
+    int g = blockDim.x * blockIdx.x + threadIdx.x;
+
+    if (g < WH) {
+        float x = X[g];
+        float y = Y[g];
         float result = 0;
 
-        // Copy data that will be used multiple times per thread into local memory (this might not matter though).
-        float local_X = X[g];
-        float local_Y = Y[g];
-        float coefficient;
-
-        // Local helper variables.
-        float monomial = 1;
-        int i, j, nx, ny, nx0, ny0 = 0;
-
-        // Loop over all the spots (compiler should handle optimizing the trinary).
-        for (i = 0; i < N; i++) {
-            coefficient = coefficients[i];
-
-            if (coefficient != 0) {
-                nx = pxy[i];
-                ny = pxy[i+N];
-
-                // Reset if we're starting a new path.
-                if (nx - nx0 < 0 || ny - ny0 < 0) {
-                    nx0 = ny0 = 0;
-                    monomial = 1;
-                }
-
-                // Traverse the path in +x or +y.
-                for (j = 0; j < nx - nx0; j++) {
-                    monomial *= local_X;
-                }
-                for (j = 0; j < ny - ny0; j++) {
-                    monomial *= local_Y;
-                }
-
-                // Add the monomial to the result.
-                result += coefficients[i] * monomial;
-
-                // Update the state of the monomial
-                nx0 = nx;
-                ny0 = ny;
+        // Vortex.
+        if (l != 0) {
+            result = l * atan2f(x, y);
+        }
+
+        // Pi steps where the Laguerre polynomial of the radius is negative (Horner's scheme).
+        if (D > 0) {
+            float rr = scale * (x * x + y * y);
+            float laguerre = coefficients[D-1];
+
+            for (int k = D-2; k >= 0; k--) {
+                laguerre = laguerre * rr + coefficients[k];
+            }
+
+            if (laguerre < 0) {
+                result += 3.14159265358979f;
             }
         }
 
-        // Export the result to global memory.
         out[g] = result;
     }
 }
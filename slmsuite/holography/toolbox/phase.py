@@ -1,16 +1,30 @@
 """
 Repository of common analytic phase patterns.
+
+Functions which compute on a grid dispatch on the array module of the grid, so passing
+:mod:`cupy` grids (e.g. those of an SLM) yields :mod:`cupy` results computed on the GPU
+without host round-trips.
 """
 import os
+import functools
 import warnings
+import weakref
 import time
 import numpy as np
 try:
     import cupy as cp   # type: ignore
 except ImportError:
     cp = np
+try:
+    import numba        # type: ignore
+except ImportError:
+    numba = None
+try:
+    import numexpr      # type: ignore
+except ImportError:
+    numexpr = None
 from scipy import special
-from math import factorial
+from math import comb, factorial, isqrt
 import matplotlib.pyplot as plt
 from typing import Tuple, Union, Callable
 
@@ -32,6 +46,71 @@ except:
     warnings.warn("Unable to load toolbox/cuda.cu; cannot use custom GPU kernels.")
     CUDA_KERNELS = None
 
+def _get_module(array):
+    """Returns the array module (:mod:`numpy` or :mod:`cupy`) that ``array`` belongs to."""
+    if cp is np:
+        return np
+    else:
+        return cp.get_array_module(array)
+
+def _numexpr(x_grid):
+    """Returns whether ``x_grid`` should be evaluated with :mod:`numexpr`."""
+    return numexpr is not None and isinstance(x_grid, np.ndarray) and x_grid.size > 1
+
+def _numexpr_evaluate(expression, x_grid, y_grid, **constants):
+    """
+    Evaluates ``expression`` of ``x`` and ``y`` with :mod:`numexpr` in a single multithreaded
+    pass. Constants are cast to the dtype of floating point grids so that single-precision
+    grids stay single-precision, as they would with :mod:`numpy` broadcasting. Integer grids
+    promote to float, as with :mod:`numpy`.
+    """
+    if np.issubdtype(x_grid.dtype, np.floating):
+        dtype = x_grid.dtype.type
+    else:
+        dtype = np.result_type(x_grid.dtype, float).type
+    local_dict = {key : dtype(value) for key, value in constants.items()}
+    local_dict["x"] = x_grid
+    local_dict["y"] = y_grid
+    return numexpr.evaluate(expression, local_dict=local_dict)
+
+
+# Helpers derived from a grid (e.g. Zernike masks, the polar angle of the grid).
+#   {(id(x_grid), id(y_grid), shape, endpoints) : {key : value, ... }, ... }
+_grid_cache = {}
+
+
+def _grid_cached(x_grid, y_grid, key, factory):
+    """
+    Returns ``factory()``, cached against the grids and ``key``. Grids are identified by
+    ``id()`` along with their shape and endpoint values, such that grids modified in place
+    (e.g. rescaled) are recomputed. Entries are dropped when ``x_grid`` is garbage collected,
+    so ``factory()`` must not return (views of) the grids themselves, which would keep
+    them alive. Cached values are shared and must not be modified.
+    """
+    corner = (0,) * np.ndim(x_grid)
+    end = (-1,) * np.ndim(x_grid)
+    grid_key = (
+        id(x_grid), id(y_grid), np.shape(x_grid),
+        float(x_grid[corner]), float(x_grid[end]), float(y_grid[corner]), float(y_grid[end])
+    )
+
+    entries = _grid_cache.get(grid_key, None)
+    if entries is None:
+        entries = _grid_cache[grid_key] = {}
+        try:
+            weakref.finalize(x_grid, _grid_cache.pop, grid_key, None)
+        except TypeError:   # Objects which do not support weak references.
+            pass
+
+    if not key in entries:
+        # Avoid unbounded growth when sweeping many apertures on the same grid.
+        if len(entries) > 16:
+            entries.clear()
+        entries[key] = factory()
+
+    return entries[key]
+
+
 # Basic gratings.
 
 def blaze(
@@ -57,20 +136,34 @@ def blaze(
     :return:
         The phase for this function.
     """
-    (x_grid, y_grid) = _process_grid(grid)
+    # Terms are scaled in place, so integer grids are promoted first.
+    (x_grid, y_grid) = _grid_astype(*_process_grid(grid))
+    xp = _get_module(x_grid)
 
     # Optimize phase construction based on context.
     if vector[0] == 0 and vector[1] == 0:
-        result = np.zeros_like(x_grid)
+        result = xp.zeros_like(x_grid)
     elif vector[1] == 0:
         result = (2 * np.pi * vector[0]) * x_grid
     elif vector[0] == 0:
         result = (2 * np.pi * vector[1]) * y_grid
+    elif _numexpr(x_grid):
+        result = _numexpr_evaluate(
+            "a * x + b * y", x_grid, y_grid,
+            a=2 * np.pi * vector[0], b=2 * np.pi * vector[1]
+        )
     else:
-        result = (2 * np.pi * vector[0]) * x_grid + (2 * np.pi * vector[1]) * y_grid
-
-    if len(vector) > 2:
-        result += (np.pi * vector[2]) * (np.square(x_grid) + np.square(y_grid))
+        # Fold the y slope into the x term so that only one full-size array is written:
+        # 2pi (kx x + ky y) = 2pi kx (x + (ky / kx) y).
+        result = (vector[1] / vector[0]) * y_grid
+        result += x_grid
+        result *= 2 * np.pi * vector[0]
+
+    if len(vector) > 2 and vector[2] != 0:
+        focus = xp.square(x_grid)
+        focus += xp.square(y_grid)
+        focus *= np.pi * vector[2]
+        result += focus
 
     return result
 
@@ -117,9 +210,14 @@ def sinusoid(
     """
     if vector[0] == 0 and vector[1] == 0:
         (x_grid, _) = _process_grid(grid)
-        result = np.full_like(x_grid, (a-b)/2 * (1 + np.sin(shift)))
+        result = _get_module(x_grid).full_like(x_grid, (a-b)/2 * (1 + np.sin(shift)))
     else:
-        result = (a-b)/2 * (1 + np.sin(blaze(grid, vector) + shift))
+        result = blaze(grid, vector)
+        xp = _get_module(result)
+        result += shift
+        xp.sin(result, out=result)
+        result += 1
+        result *= (a-b)/2
 
     # Add offset if provided.
     if b != 0:
@@ -209,15 +307,16 @@ def binary(
         The phase for this function.
     """
     grid = (x_grid, y_grid) = _process_grid(grid)
+    xp = _get_module(x_grid)
     dtype = x_grid.dtype
     duty_cycle = np.clip(float(duty_cycle), 0, 1)
 
     # Check if we're in pixel period mode.
     if np.any(np.abs(vector) > 1):
         # This is not computationally efficient.
-        grid = (x_grid, y_grid) = np.meshgrid(
-            np.arange(x_grid.shape[1]).astype(float),
-            np.arange(x_grid.shape[0]).astype(float)
+        grid = (x_grid, y_grid) = xp.meshgrid(
+            xp.arange(x_grid.shape[1]).astype(float),
+            xp.arange(x_grid.shape[0]).astype(float)
         )
         vector = (
             0 if vector[0] == 0 else 1. / vector[0],
@@ -230,7 +329,7 @@ def binary(
         if shift != 0:
             if np.mod(shift, 2*np.pi) > (2 * np.pi * duty_cycle):
                 phase = a
-        return np.full(x_grid.shape, phase, dtype=dtype)
+        return xp.full(x_grid.shape, phase, dtype=dtype)
     elif vector[0] != 0 and vector[1] != 0:
         pass    # xor the next case.
     elif vector[0] == 0 or vector[1] == 0:
@@ -243,15 +342,15 @@ def binary(
         if np.all(np.isclose(period, period_int)) and np.all(np.isclose(duty, duty_int)):
             pass    # Future: speed optimization.
 
-    decision = np.mod(blaze(grid, vector) + shift, 2*np.pi)
-    decision[np.isclose(decision, 2*np.pi)] = 0   # Handle edge case
+    decision = xp.mod(blaze(grid, vector) + shift, 2*np.pi)
+    decision[xp.isclose(decision, 2*np.pi)] = 0   # Handle edge case
     decision -= (2 * np.pi * (1-duty_cycle))
 
     # If we have not returned, then we have to use the slow np.mod option.
-    return np.where(
-        np.logical_or(
+    return xp.where(
+        xp.logical_or(
             decision > 0,
-            np.isclose(decision, 0)
+            xp.isclose(decision, 0)
         ),
         a,
         b,
@@ -274,7 +373,7 @@ def _quadrants(
 
     # Parse grid.
     grid = (x_grid, y_grid) = _process_grid(grid)
-    canvas = np.zeros_like(x_grid)
+    canvas = _get_module(x_grid).zeros_like(x_grid)
 
     # Fill the quadrants.
     for i, vector in enumerate(vectors.T):
@@ -438,18 +537,34 @@ def lens(grid, f=(np.inf, np.inf)):
     numpy.ndarray
         The phase for this function.
     """
-    (x_grid, y_grid) = _process_grid(grid)
+    # The square is scaled in place, so integer grids are promoted first.
+    (x_grid, y_grid) = _grid_astype(*_process_grid(grid))
+    xp = _get_module(x_grid)
     f = _parse_focal_length(f)
 
     # Optimize phase construction based on context (for speed, to avoid square, etc).
-    if np.isfinite(f[0]) and np.isfinite(f[1]):
-        return (np.pi / f[0]) * np.square(x_grid) + (np.pi / f[1]) * np.square(y_grid)
-    elif np.isfinite(f[0]) and np.isfinite(f[1]):
-        return (np.pi / f[0]) * np.square(x_grid)
-    elif np.isfinite(f[1]):
-        return (np.pi / f[1]) * np.square(y_grid)
+    finite_x = np.isfinite(f[0])
+    finite_y = np.isfinite(f[1])
+
+    if finite_x and finite_y and _numexpr(x_grid):
+        result = _numexpr_evaluate(
+            "a * x * x + b * y * y", x_grid, y_grid,
+            a=np.pi / f[0], b=np.pi / f[1]
+        )
+    elif finite_x:
+        result = xp.square(x_grid)
+        result *= np.pi / f[0]
+        if finite_y:
+            focus_y = xp.square(y_grid)
+            focus_y *= np.pi / f[1]
+            result += focus_y
+    elif finite_y:
+        result = xp.square(y_grid)
+        result *= np.pi / f[1]
     else:
-        return np.zeros_like(x_grid)
+        result = xp.zeros_like(x_grid)
+
+    return result
 
 
 def axicon(grid, f=(np.inf, np.inf), w=None):
@@ -481,7 +596,9 @@ def axicon(grid, f=(np.inf, np.inf), w=None):
     numpy.ndarray
         The phase for this function.
     """
-    (x_grid, y_grid) = _process_grid(grid)
+    # Terms are scaled in place, so integer grids are promoted first.
+    (x_grid, y_grid) = _grid_astype(*_process_grid(grid))
+    xp = _get_module(x_grid)
     w = _determine_source_radius(grid, w)
     f = _parse_focal_length(f)
 
@@ -489,13 +606,19 @@ def axicon(grid, f=(np.inf, np.inf), w=None):
 
     # Optimize phase construction based on context (for speed, to avoid sqrt, etc).
     if angle[0] == 0 and angle[1] == 0:
-        return 0 * x_grid
+        return xp.zeros_like(x_grid)
     elif angle[0] == 0:
-        return (2 * np.pi * angle[1]) * np.abs(y_grid)
+        result = xp.abs(y_grid)
+        result *= 2 * np.pi * angle[1]
     elif angle[1] == 0:
-        return (2 * np.pi * angle[0]) * np.abs(x_grid)
+        result = xp.abs(x_grid)
+        result *= 2 * np.pi * angle[0]
     else:
-        return (2 * np.pi) * np.sqrt(np.square(x_grid * angle[0]) + np.square(y_grid * angle[1]))
+        # hypot fuses the squares, sum, and root into a single pass.
+        result = xp.multiply(x_grid, 2 * np.pi * angle[0])
+        xp.hypot(result, y_grid * (2 * np.pi * angle[1]), out=result)
+
+    return result
 
 
 # Zernike.
@@ -630,7 +753,7 @@ def zernike_convert_index(indices, from_index="ansi", to_index="ansi"):
         # Inverse functions have not been implemented.
         raise NotImplementedError(f"from_index '{from_index}' is not supported currently.")
     elif from_index == "ansi":
-        n = np.floor(.5 * np.sqrt(8*indices + 1) - .5).astype(int)
+        n = _triangular_root(indices)
         l = 2*indices - n*(n+2)
 
     # Error check n,l
@@ -660,6 +783,19 @@ def zernike_convert_index(indices, from_index="ansi", to_index="ansi"):
     return result
 
 
+def _zernike_ansi_to_radial(index):
+    """
+    Scalar fast path of :meth:`zernike_convert_index()` from ANSI to radial indices.
+    Uses plain integer arithmetic to avoid array construction for a single index.
+    """
+    index = int(index)
+    if index < 0:
+        raise ValueError(f"Invalid Zernike index {index}. ANSI indices must be non-negative.")
+
+    n = (isqrt(8*index + 1) - 1) // 2
+    return n, 2*index - n*(n+2)
+
+
 def zernike_aperture(grid, aperture=None):
     """
     Helper function to find the appropriate scaling for between the normalized units in
@@ -740,15 +876,14 @@ def zernike_aperture(grid, aperture=None):
             aperture = "cropped"
 
     if isinstance(aperture, str):
-        if aperture == "elliptical":
-            x_scale = 1 / np.nanmax(x_grid)
-            y_scale = 1 / np.nanmax(y_grid)
-        elif aperture == "circular":
-            x_scale = y_scale = 1 / np.amin([np.nanmax(x_grid), np.nanmax(y_grid)])
-        elif aperture == "cropped":
-            x_scale = y_scale = 1 / np.sqrt(np.nanmax(np.square(x_grid) + np.square(y_grid)))
-        else:
+        if aperture not in ("elliptical", "circular", "cropped"):
             raise ValueError(f"Aperture '{aperture}' is not implemented.")
+
+        # The full-grid scans are cached, as the grid is generally fixed.
+        (x_scale, y_scale) = _grid_cached(
+            x_grid, y_grid, ("aperture", aperture),
+            lambda: _zernike_aperture_scan(x_grid, y_grid, aperture)
+        )
     elif np.isscalar(aperture):
         x_scale = y_scale = aperture
     elif isinstance(aperture, (list, tuple, np.ndarray)) and len(aperture) == 2:
@@ -760,6 +895,21 @@ def zernike_aperture(grid, aperture=None):
     return (x_scale, y_scale)
 
 
+def _zernike_aperture_scan(x_grid, y_grid, aperture):
+    """Computes the scaling for the string ``aperture`` options of :meth:`zernike_aperture()`."""
+    if aperture == "elliptical":
+        x_scale = 1 / np.nanmax(x_grid)
+        y_scale = 1 / np.nanmax(y_grid)
+    elif aperture == "circular":
+        x_scale = y_scale = 1 / np.amin([np.nanmax(x_grid), np.nanmax(y_grid)])
+    elif aperture == "cropped":
+        rr = np.square(x_grid)
+        rr += np.square(y_grid)
+        x_scale = y_scale = 1 / np.sqrt(np.nanmax(rr))
+
+    return (x_scale, y_scale)
+
+
 def zernike(grid, index, weight=1, **kwargs):
     r"""
     Returns a single real
@@ -859,18 +1009,12 @@ def _zernike_get_cantor(indices, weights, derivative=(0,0)):
 
         for j in [0, 1]:
             if derivative[j] > 0:
-                power = cantor_pairing[:, [j]].T.astype(int)  # (D, 1)
+                power = cantor_pairing[:, [j]].T.astype(int)  # (1, M')
 
-                # Apply the power rule.
-                if derivative[j] == 1:
-                    zernike_cantor *= power
-                elif derivative[j] > 1:
-                    nonzero = power >= derivative[j]
-
-                    zernike_cantor[np.logical_not(nonzero)] = 0
-                    zernike_cantor[nonzero] *= (
-                        special.factorial(power[nonzero]) / special.factorial(power[nonzero] - derivative[j])
-                    ).astype(int)
+                # Apply the power rule with the exact falling factorial p! / (p-d)!.
+                # This is zero for terms of power p < d, which vanish.
+                for k in range(derivative[j]):
+                    zernike_cantor *= np.maximum(power - k, 0)
 
                 # Reduce the power of the term
                 cantor_pairing[:, j] -= derivative[j]
@@ -941,7 +1085,10 @@ def _zernike_indices_parse(indices=None, D=None, smaller_okay=False):
     return indices
 
 
-def zernike_sum(grid, indices, weights, aperture=None, use_mask=True, derivative=(0,0), out=None):
+def zernike_sum(
+        grid, indices, weights, aperture=None, use_mask=True, derivative=(0,0), out=None,
+        assume_normalized=False
+    ):
     r"""
     Returns a summation of
     `Zernike polynomials <https://en.wikipedia.org/wiki/Zernike_polynomials>`_
@@ -1051,6 +1198,10 @@ def zernike_sum(grid, indices, weights, aperture=None, use_mask=True, derivative
         generating Zernike images.
     out : array_like OR None
         Memory to be used for the phase output. Allocated separately if ``None``.
+    assume_normalized : bool
+        If ``True``, the grid is assumed to already be in units of the Zernike pupil and
+        to lie within the unit disk. ``aperture`` and ``use_mask`` are then ignored, and
+        neither the scaling nor the mask is computed; the grids are used directly.
 
     Returns
     -------
@@ -1059,7 +1210,11 @@ def zernike_sum(grid, indices, weights, aperture=None, use_mask=True, derivative
     """
     # Parse passed simple values.
     (x_grid, y_grid) = _process_grid(grid)
-    (x_scale, y_scale) = zernike_aperture(grid, aperture)
+    if assume_normalized:
+        (x_scale, y_scale) = (1, 1)
+        use_mask = False
+    else:
+        (x_scale, y_scale) = zernike_aperture(grid, aperture)
     if len(derivative) != 2:
         raise ValueError("Expected derivative to be a (int, int)")
 
@@ -1095,36 +1250,67 @@ def zernike_sum(grid, indices, weights, aperture=None, use_mask=True, derivative
     # Parse out.
     out = _parse_out(x_grid, out, stack=N)
 
+    # The mask and scaled grids only depend on the grid and scaling, so they are cached
+    # across calls (see _grid_cached).
+    scale_key = (float(x_scale), float(y_scale))
+
     # At the end, we're going to set the values outside the aperture to zero.
     # Make a mask for this if it's necessary.
     if use_mask is False:
         mask = None
     else:
-        mask = np.square(x_grid * x_scale) + np.square(y_grid * y_scale) <= 1
+        (mask, clipped) = _grid_cached(
+            x_grid, y_grid, ("mask",) + scale_key,
+            lambda: _zernike_mask(x_grid, y_grid, x_scale, y_scale)
+        )
         if use_mask == "return":
-            return mask
+            return mask.copy()
         mask_value = 0
         if np.isnan(use_mask):
             use_mask = True
             mask_value = np.nan
-        use_mask = use_mask and np.any(mask == 0)
+        use_mask = use_mask and clipped
+
+    # Gather the Zernike information.
+    cantor_terms, cantor_weights = _zernike_get_cantor(indices, weights, derivative)
+
+    # On the GPU, the masked sum is a single kernel which fills the outside of the
+    # aperture itself, rather than gathering and scattering the masked pixels.
+    # The kernel only sums monomials, so special terms (e.g. the vortex) use polynomial().
+    fused = (
+        use_mask and _polynomial_masked_kernel is not None and _get_module(x_grid) is not np
+        and out.dtype == np.float32 and out.flags.c_contiguous
+        and np.all(cantor_terms >= 0)
+    )
 
     # Make the new grids.
-    if use_mask:
-        x_grid_scaled = x_grid[mask] * x_scale
-        y_grid_scaled = y_grid[mask] * y_scale
+    if use_mask and not fused:
+        (x_grid_scaled, y_grid_scaled) = _grid_cached(
+            x_grid, y_grid, ("masked",) + scale_key,
+            lambda: (x_grid[mask] * x_scale, y_grid[mask] * y_scale)
+        )
     else:
         # Special case to avoid copying grids in the case of no scaling.
-        if x_scale == 1:    x_grid_scaled = x_grid
-        else:               x_grid_scaled = x_grid * x_scale
-        if y_scale == 1:    y_grid_scaled = y_grid
-        else:               y_grid_scaled = y_grid * y_scale
-
-    # Gather the Zernike information.
-    cantor_terms, cantor_weights = _zernike_get_cantor(indices, weights, derivative)
+        if x_scale == 1:
+            x_grid_scaled = x_grid
+        else:
+            x_grid_scaled = _grid_cached(
+                x_grid, y_grid, ("scaled x", scale_key[0]), lambda: x_grid * x_scale
+            )
+        if y_scale == 1:
+            y_grid_scaled = y_grid
+        else:
+            y_grid_scaled = _grid_cached(
+                x_grid, y_grid, ("scaled y", scale_key[1]), lambda: y_grid * y_scale
+            )
 
     # The masked case only computes on a fraction of the full space.
-    if use_mask:
+    if fused:
+        _polynomial_cuda(
+            x_grid_scaled, y_grid_scaled, cantor_terms, cantor_weights, out,
+            mask=mask, mask_value=mask_value
+        )
+    elif use_mask:
         out.fill(mask_value)
         out[:, mask] = polynomial(
             grid=(x_grid_scaled, y_grid_scaled),
@@ -1146,6 +1332,30 @@ def zernike_sum(grid, indices, weights, aperture=None, use_mask=True, derivative
         return out
 
 
+def _zernike_mask(x_grid, y_grid, x_scale, y_scale):
+    """
+    Returns the mask of the scaled Zernike pupil and whether any of the grid is clipped.
+    """
+    xp = _get_module(x_grid)
+
+    if _numexpr(x_grid):
+        mask = _numexpr_evaluate(
+            "(a * x)**2 + (b * y)**2 <= 1", x_grid, y_grid, a=x_scale, b=y_scale
+        )
+        return mask, not bool(np.all(mask))
+
+    # Build the radius in two scratch buffers rather than one temporary per operation.
+    rr = xp.multiply(x_grid, x_scale)
+    rr *= rr
+    yy = xp.multiply(y_grid, y_scale)
+    yy *= yy
+    rr += yy
+    del yy
+
+    mask = rr <= 1
+    return mask, not bool(xp.all(mask))
+
+
 def zernike_pyramid_plot(
         grid,
         order,
@@ -1329,16 +1539,49 @@ def _zernike_build_order(n):
 
 
 def _zernike_build_indices(indices):
-    """Pre-caches Zernike polynomial coefficients up to order :math:`n`."""
-    for i in indices:
+    """Pre-caches Zernike polynomial coefficients for the given ANSI ``indices``."""
+    for i in set(np.ravel(indices).tolist()).difference(_zernike_cache):
         _zernike_coefficients(i)
 
 
-def _zernike_coefficients(index):
+@functools.lru_cache(maxsize=None)
+def _zernike_radial(n, m):
+    r"""
+    Returns the integer coefficients of the Zernike radial polynomial :math:`R_n^m(\rho)`
+    as a tuple indexed by the power of :math:`\rho`. Built from the three-term recurrence
+
+    .. math:: R_n^m = \rho \left(R_{n-1}^{|m-1|} + R_{n-1}^{m+1}\right) - R_{n-2}^m,
+
+    which needs only integer additions (no factorials) and is memoized across orders.
     """
+    m = abs(m)
+
+    if m > n or (n - m) % 2:
+        return (0,) * (n + 1)
+    elif m == n:
+        return (0,) * n + (1,)
+
+    a = _zernike_radial(n - 1, abs(m - 1))
+    b = _zernike_radial(n - 1, m + 1)
+    c = _zernike_radial(n - 2, m)
+
+    # Multiplication by rho shifts the coefficients up by one power.
+    radial = [0] + [a[k] + b[k] for k in range(n)]
+    for k in range(n - 1):
+        radial[k] -= c[k]
+
+    return tuple(radial)
+
+
+def _zernike_coefficients(index):
+    r"""
     Returns the coefficients for the :math:`x^ay^b` terms of the real Zernike polynomial
     of ANSI index ``i``. This is returned as a dictionary of form ``{(a,b) : coefficient}``.
-    Uses `this algorithm <https://doi.org/10.1117/12.294412>`_.
+
+    The radial part :math:`R_n^{|l|}(\rho)` comes from a recurrence
+    (see :meth:`_zernike_radial()`) and the azimuthal part from the identity
+    :math:`\rho^{|l|} e^{i|l|\theta} = (x + iy)^{|l|}`, so every coefficient is an
+    exact integer.
     """
     index = int(index)
 
@@ -1346,52 +1589,27 @@ def _zernike_coefficients(index):
     if not index in _zernike_cache:
         zernike_this = {}
 
-        (n, l) = zernike_convert_index(index, to_index="radial")[0]
-        l = -l
+        (n, l) = _zernike_ansi_to_radial(index)
+        m = abs(l)
 
-        # Define helper variables.
-        if l % 2:   # If even
-            q = int((abs(l) - 1) / 2)
-        else:
-            if l > 0:
-                q = int(abs(l)/2 - 1)
-            else:
-                q = int(abs(l)/2)
+        # Since R_n^m only contains the powers rho^(m+2j), R_n^m / rho^m is a polynomial
+        # in rho^2 = x^2 + y^2.
+        radial = _zernike_radial(n, m)[m::2]
 
-        if l <= 0:
-            p = 0
-        else:
-            p = 1
-
-        l = abs(l)
-        m = int((n-l)/2)
-
-        # Helper function
-        def comb(n, k):
-            return factorial(n) / (factorial(k) * factorial(n-k))
-
-        # Finding the coefficients is a summed combinatorial search.
-        # This is why we cache: so we don't have to do this many times,
-        # especially for higher order polynomials and the corresponding cubic scaling.
-        for i in range(q+1):
-            for j in range(m+1):
-                for k in range(m-j+1):
-                    factor = -1 if (i + j) % 2 else 1
-                    factor *= comb(l, 2 * i + p)
-                    factor *= comb(m - j, k)
-                    factor *= (
-                        float(factorial(n - j))
-                        / (factorial(j) * factorial(m - j) * factorial(n - m - j))
-                    )
-
-                    power_key = (int(n - 2*(i + j + k) - p), int(2 * (i + k) + p))
-
-                    # Add this coefficient to the element in the dictionary
-                    # corresponding to the right power.
-                    if power_key in zernike_this:
-                        zernike_this[power_key] += int(factor)
-                    else:
-                        zernike_this[power_key] = int(factor)
+        # Real (cosine, l >= 0) or imaginary (sine, l < 0) part of (x + iy)^m.
+        azimuthal = {}
+        for k in range(int(l < 0), m + 1, 2):
+            azimuthal[(m - k, k)] = (-1 if (k // 2) % 2 else 1) * comb(m, k)
+
+        # Expand (x^2 + y^2)^j and multiply by the azimuthal part.
+        for j, r in enumerate(radial):
+            if r == 0:
+                continue
+            for k in range(j + 1):
+                factor = r * comb(j, k)
+                for (a, b), c in azimuthal.items():
+                    power_key = (a + 2 * k, b + 2 * (j - k))
+                    zernike_this[power_key] = zernike_this.get(power_key, 0) + factor * c
 
         # Update the cache. Remove all factors that have cancelled out (== 0).
         _zernike_cache[index] = {
@@ -1435,8 +1653,7 @@ def _zernike_populate_basis_map(indices):
     other_indices = indices[indices < 0]
 
     # Make sure all coefficients are generated.
-    for i in zernike_indices:
-        _zernike_coefficients(i)
+    _zernike_build_indices(zernike_indices)
 
     # Determine the cantor indices.
     nonzero_cantor_indices = np.any(_zernike_cache_vectorized[zernike_indices, :], axis=0)
@@ -1523,13 +1740,29 @@ def _zernike_test(grid, indices):
 
 # Polynomials.
 
+def _triangular_root(z):
+    r"""
+    Returns the largest integer :math:`w` with :math:`w(w+1)/2 \leq z`, exactly, for an
+    integer array ``z``. Negative ``z`` returns ``0``.
+    """
+    z = np.maximum(z, 0)
+    w = (np.sqrt(8*z + 1).astype(np.int64) - 1) // 2
+
+    # Correct any floating point error in the square root.
+    w -= (w * (w + 1)) // 2 > z
+    w += ((w + 1) * (w + 2)) // 2 <= z
+
+    return w
+
+
 def _cantor_pairing(xy):
     """
     Converts a 2D index to a unique 1D index according to the
     `Cantor pairing function <https://en.wikipedia.org/wiki/Pairing_function>`.
     """
-    xy = np.array(xy, dtype=int, copy=(False if np.__version__[0] == '1' else None)).reshape((-1, 2))
-    return np.rint(.5 * (xy[:,0] + xy[:,1]) * (xy[:,0] + xy[:,1] + 1) + xy[:,1]).astype(int)
+    xy = np.array(xy, dtype=np.int64, copy=(False if np.__version__[0] == '1' else None)).reshape((-1, 2))
+    s = xy[:,0] + xy[:,1]
+    return (s * (s + 1)) // 2 + xy[:,1]
 
 
 def _inverse_cantor_pairing(z):
@@ -1543,7 +1776,7 @@ def _inverse_cantor_pairing(z):
     if z.ndim != 1:
         raise ValueError("Expected a list of shape (D,)")
 
-    w = np.floor((np.sqrt(8*z + 1) - 1) // 2).astype(int)
+    w = _triangular_root(z)
     t = (w*w + w) // 2
 
     y = z-t
@@ -1580,49 +1813,61 @@ def _term_pathing(xy):
         Array of shape ``(M,)``. Best coefficient order.
     """
     # Prepare helper variables.
-    xy = np.array(xy, dtype=int, copy=(False if np.__version__[0] == '1' else None))
+    xy = np.array(xy, dtype=np.int64, copy=(False if np.__version__[0] == '1' else None))
 
     order = np.sum(xy, axis=1)
-    delta = np.squeeze(np.diff(xy, axis=1))
+    delta = xy[:, 1] - xy[:, 0]
 
     cantor = _cantor_pairing(xy)
     cantor_index = np.argsort(-cantor)
 
-    # Prepare the output data structure.
-    I = np.zeros_like(order, dtype=int)
-
-    # Helper function to recurse through pathing options.
-    def recurse(i0, j0):
-        # Fill in the current values.
-        I[j0] = cantor_index[i0]
-        cantor[cantor_index[i0]] = -1
+    return _term_pathing_loop(order, delta, cantor, cantor_index)
 
-        if j0 == 0:
-            return 0
 
-        # Figure out the distance between the current index and all other indices.
-        dd = delta - delta[cantor_index[i0]]
-        do = order[cantor_index[i0]] - order
-
-        # Find the best candidate for the next index in the thread.
-        nearest = -cantor + np.where((np.abs(dd) > do) + (do <= 0) + (cantor < 0), np.inf, 0)
-        i = np.argmin(nearest[cantor_index])
-
-        # Either exit or continue this thread.
-        if cantor[cantor_index[i]] != -1:
-            return recurse(i, j0-1)
-        else:
-            return j0-1
+def _term_pathing_loop(order, delta, cantor, cantor_index):
+    """
+    Iterative core of :meth:`_term_pathing()`. Each outer iteration starts a new thread of
+    terms at the largest unused Cantor index and follows it toward lower orders until the
+    thread dead-ends, filling the output from the back. ``cantor`` is consumed (set to
+    ``-1`` for used terms). Compiled with numba when available.
+    """
+    I = np.zeros_like(order)
 
     # Traverse backwards through the array,
-    j = len(I)-1
+    j = len(I) - 1
     for i in range(len(order)):
         if cantor[cantor_index[i]] >= 0 and j >= 0:
-            j = recurse(i, j)
+            i0 = i
+
+            while True:
+                # Fill in the current values.
+                k = cantor_index[i0]
+                I[j] = k
+                cantor[k] = -1
+
+                if j == 0:
+                    break
+
+                # Figure out the distance between the current index and all other indices.
+                dd = delta - delta[k]
+                do = order[k] - order
+
+                # Find the best candidate for the next index in the thread.
+                nearest = -cantor + np.where((np.abs(dd) > do) | (do <= 0) | (cantor < 0), np.inf, 0.)
+                i0 = np.argmin(nearest[cantor_index])
+                j -= 1
+
+                # Either exit or continue this thread.
+                if cantor[cantor_index[i0]] == -1:
+                    break
 
     return I
 
 
+if numba is not None:
+    _term_pathing_loop = numba.njit(cache=True)(_term_pathing_loop)
+
+
 def _parse_out(x_grid, out, stack=1):
     """
     Helper function to error check the shape and type of ``out``.
@@ -1631,24 +1876,293 @@ def _parse_out(x_grid, out, stack=1):
 
     if out is None:
         # Initialize out to zero.
-        if cp == np:
-            out = np.zeros(shape, x_grid.dtype)
-        else:
-            out = cp.get_array_module(x_grid).zeros(shape, x_grid.dtype)
-
-        return out
+        return _get_module(x_grid).zeros(shape, x_grid.dtype)
     else:
         # Error check user-provided out.
         if out.size != np.prod(shape):
             raise ValueError("out must have same size as the stacked grid.")
         if out.dtype != x_grid.dtype:
             raise ValueError("out must have same type as grid.")
-        if cp != np and cp.get_array_module(x_grid) != cp.get_array_module(out):
+        if _get_module(x_grid) != _get_module(out):
             raise ValueError("out and grid must both be cupy arrays if one is.")
 
         return out.reshape(shape)
 
 
+def _polynomial_table(terms, weights):
+    """
+    Buckets monomial ``terms`` of shape ``(D, 2)`` and ``weights`` of shape ``(D, N)``
+    into a dense coefficient table of shape ``(A+1, B+1, N)``, indexed by the
+    :math:`x` and :math:`y` exponents and summing any duplicate terms.
+    """
+    (A, B) = np.max(terms, axis=0)
+    N = weights.shape[1]
+
+    if np.iscomplexobj(weights):
+        coefficients = np.zeros((A+1, B+1, N), dtype=weights.dtype)
+        np.add.at(coefficients, (terms[:, 0], terms[:, 1]), weights)
+        return coefficients
+
+    # Merge all terms and stacks in one vectorized pass.
+    flat = (terms[:, [0]] * (B+1) + terms[:, [1]]) * N + np.arange(N)
+    coefficients = np.bincount(np.ravel(flat), weights=np.ravel(weights), minlength=(A+1)*(B+1)*N)
+
+    return coefficients.reshape((A+1, B+1, N)).astype(weights.dtype, copy=False)
+
+
+# Largest power of x or y tabulated by _polynomial_horner (each costs a grid of memory).
+_POLYNOMIAL_POWER_TABLE = 4
+
+
+def _polynomial_horner(x_grid, y_grid, terms, weights, out):
+    r"""
+    Accumulates the monomial sum :math:`\sum w_{ab}x^ay^b` into ``out`` using a nested
+    `Horner scheme <https://en.wikipedia.org/wiki/Horner%27s_method>`_: outer in
+    :math:`x`, inner in :math:`y`. Every step is an in-place multiply or add, so no
+    full-grid temporaries are created and the cost per pixel is one multiply-add per
+    (nonzero) coefficient rather than a power and product per term.
+
+    Parameters
+    ----------
+    x_grid, y_grid : numpy.ndarray OR cupy.ndarray
+        Grids to evaluate upon.
+    terms : numpy.ndarray
+        Array of shape ``(D, 2)`` of non-negative :math:`x` and :math:`y` exponents.
+    weights : numpy.ndarray
+        Array of shape ``(D, N)`` of coefficients.
+    out : numpy.ndarray OR cupy.ndarray
+        Array of shape ``(N, ...)`` to accumulate into.
+    """
+    if len(terms) == 0:
+        return out
+
+    # Bucket the terms into a dense coefficient tensor, summing any duplicates.
+    coefficients = _polynomial_table(terms, weights)
+
+    # Small tables of powers, so that jumping over zero coefficients (e.g. the x^2 or
+    # y^2 steps of same-parity Zernike terms) costs one multiply instead of several.
+    x_powers = [None, x_grid]
+    y_powers = [None, y_grid]
+
+    def multiply_power(array, powers, k):
+        while k > 0:
+            step = min(k, _POLYNOMIAL_POWER_TABLE)
+            while len(powers) <= step:
+                powers.append(powers[-1] * powers[1])
+            array *= powers[step]
+            k -= step
+
+    row = None
+
+    for i in range(weights.shape[1]):
+        total = out[i, ...]
+        rows = np.flatnonzero(np.any(coefficients[:, :, i], axis=1))[::-1]
+
+        for r, a in enumerate(rows):
+            # Horner step in x, jumping over empty rows.
+            if r > 0:
+                multiply_power(total, x_powers, rows[r-1] - a)
+
+            bs = np.flatnonzero(coefficients[a, :, i])[::-1]
+
+            if bs[0] == 0:
+                # Constant row; no need to touch the row buffer.
+                total += coefficients[a, 0, i]
+            else:
+                if row is None:
+                    row = x_grid.copy()
+
+                # Horner in y for this row, jumping over zero coefficients.
+                row.fill(coefficients[a, bs[0], i])
+                for b0, b1 in zip(bs[:-1], bs[1:]):
+                    multiply_power(row, y_powers, b0 - b1)
+                    row += coefficients[a, b1, i]
+                multiply_power(row, y_powers, bs[-1])
+
+                total += row
+
+        if len(rows):
+            multiply_power(total, x_powers, rows[-1])
+
+    return out
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _polynomial_numba_kernel(coefficients, lengths, X, Y, out):
+        """
+        Per-pixel version of :meth:`_polynomial_horner()`: each (parallel) loop iteration
+        evaluates the nested Horner scheme for one pixel entirely in registers.
+        ``lengths[a]`` is one more than the largest :math:`y` exponent in row ``a``.
+        """
+        (A, _, N) = coefficients.shape
+
+        for g in numba.prange(X.size):
+            local_X = X[g]
+            local_Y = Y[g]
+
+            for i in range(N):
+                total = 0.0
+                for a in range(A-1, -1, -1):
+                    row = 0.0
+                    for b in range(lengths[a]-1, -1, -1):
+                        row = row * local_Y + coefficients[a, b, i]
+                    total = total * local_X + row
+
+                out[i, g] += total
+else:
+    _polynomial_numba_kernel = None
+
+
+def _polynomial_numba(x_grid, y_grid, terms, weights, out):
+    """
+    Accumulates the monomial sum into ``out`` with :meth:`_polynomial_numba_kernel()`.
+    Arguments are the same as :meth:`_polynomial_horner()`; ``out`` must be C-contiguous.
+    """
+    if len(terms) == 0:
+        return out
+
+    coefficients = _polynomial_table(terms, weights)
+
+    # Trim each row to its highest nonzero y exponent.
+    nonzero = np.any(coefficients != 0, axis=2)
+    lengths = np.where(
+        np.any(nonzero, axis=1),
+        nonzero.shape[1] - np.argmax(nonzero[:, ::-1], axis=1),
+        0
+    )
+
+    _polynomial_numba_kernel(
+        coefficients,
+        lengths,
+        np.ascontiguousarray(x_grid).ravel(),
+        np.ascontiguousarray(y_grid).ravel(),
+        out.reshape((out.shape[0], -1)),
+    )
+
+    return out
+
+
+def _polynomial_matmul(x_grid, y_grid, terms, weights, out):
+    r"""
+    Accumulates a stack of monomial sums into ``out`` as the single matrix product
+
+    .. math:: \vec{\phi}_i = \sum_k w_{ki} \vec{\Phi}_k,
+
+    where each row :math:`\vec{\Phi}_k = x^{a_k}y^{b_k}` of the monomial basis is built once
+    from cached powers of :math:`x` and :math:`y`. This is preferable when the stack
+    is at least as deep as the basis (e.g. a stack of individual Zernike
+    polynomials), as the basis then takes no more memory than ``out`` and the
+    summation becomes a BLAS call. Arguments are the same as
+    :meth:`_polynomial_horner()`; ``out`` must be C-contiguous.
+    """
+    xp = _get_module(x_grid)
+
+    # Merge duplicate terms.
+    coefficients = _polynomial_table(terms, weights)
+    nonzero = np.any(coefficients != 0, axis=2)
+    terms = np.argwhere(nonzero)
+    merged = coefficients[nonzero]
+
+    if len(terms) == 0:
+        return out
+
+    x = xp.ravel(x_grid)
+    y = xp.ravel(y_grid)
+
+    # Powers of x and y (index 0 is unused; x^0 y^0 is handled directly).
+    (A, B) = np.max(terms, axis=0)
+    x_powers = [None, x]
+    for _ in range(2, A+1):
+        x_powers.append(x_powers[-1] * x)
+    y_powers = [None, y]
+    for _ in range(2, B+1):
+        y_powers.append(y_powers[-1] * y)
+
+    basis = xp.empty((len(terms), x.size), dtype=out.dtype)
+    for k, (a, b) in enumerate(terms):
+        if a == 0 and b == 0:
+            basis[k].fill(1)
+        elif b == 0:
+            basis[k] = x_powers[a]
+        elif a == 0:
+            basis[k] = y_powers[b]
+        else:
+            xp.multiply(x_powers[a], y_powers[b], out=basis[k])
+
+    out_flat = out.reshape((out.shape[0], -1))
+    out_flat += xp.matmul(xp.asarray(merged.T), basis)
+
+    return out
+
+
+try:
+    _polynomial_kernel = cp.RawKernel(CUDA_KERNELS, 'polynomial')
+    _polynomial_masked_kernel = cp.RawKernel(CUDA_KERNELS, 'polynomial_masked')
+except:
+    _polynomial_kernel = None
+    _polynomial_masked_kernel = None
+
+# Device-side pathing and exponents, keyed by the bytes of the (host) terms.
+_polynomial_cuda_cache = {}
+
+
+def _polynomial_cuda(x_grid, y_grid, terms, weights, out, mask=None, mask_value=0):
+    """
+    Accumulates the monomial sum into ``out`` with the ``polynomial`` kernel in cuda.cu.
+    Arguments are the same as :meth:`_polynomial_horner()`, with ``float32`` cupy
+    grids and a C-contiguous ``out`` which must be zero beforehand.
+    The kernel traverses terms in :meth:`_term_pathing()` order; this path and the
+    uploaded exponents are cached so a fixed basis is only copied to the device once.
+
+    If a boolean ``mask`` of the grid shape is given, the ``polynomial_masked`` kernel
+    instead only computes the pixels inside the mask and writes ``mask_value``
+    everywhere else, so ``out`` need not be zero.
+    """
+    if len(terms) == 0:
+        if mask is not None:
+            out[...] = mask_value
+            out[:, mask] = 0
+        return out
+
+    key = terms.astype(np.int16).tobytes()
+    if not key in _polynomial_cuda_cache:
+        if len(_polynomial_cuda_cache) > 64:
+            _polynomial_cuda_cache.clear()
+
+        pathing = _term_pathing(terms)
+        pxy = cp.array(terms[pathing, :].T.astype(np.int16).ravel())     # (2*M) [nx..., ny...]
+        _polynomial_cuda_cache[key] = (pathing, pxy)
+
+    (pathing, pxy) = _polynomial_cuda_cache[key]
+
+    M = len(pathing)
+    coefficients = cp.array(weights[pathing, :].T, dtype=np.float32, order="C")   # (N, M)
+    X = cp.ascontiguousarray(x_grid).ravel()
+    Y = cp.ascontiguousarray(y_grid).ravel()
+    out_flat = out.reshape((out.shape[0], -1))
+
+    WH = X.size
+    if mask is None:
+        kernel = _polynomial_kernel
+        extra = ()
+    else:
+        kernel = _polynomial_masked_kernel
+        extra = (cp.ascontiguousarray(mask).ravel(), np.float32(mask_value))
+    threads_per_block = int(kernel.max_threads_per_block)
+    blocks = (WH + threads_per_block - 1) // threads_per_block
+
+    # Call the RawKernel once per stacked polynomial.
+    for i in range(out_flat.shape[0]):
+        kernel(
+            (blocks,),
+            (threads_per_block,),
+            (np.int32(WH), np.int32(M), coefficients[i], pxy, X, Y) + extra + (out_flat[i],)
+        )
+
+    return out
+
+
 def polynomial(grid, weights, terms=None, pathing=None, out=None):
     r"""
     Returns a summation of monomials. Specifically,
@@ -1673,10 +2187,17 @@ def polynomial(grid, weights, terms=None, pathing=None, out=None):
         Otherwise, array of shape ``(D,)`` corresponding to the Cantor indices of
         monomials.
         If ``None``, assumes the terms are Cantor indices of the range of ``weights``.
-    pathing : array_like of int OR None
+    pathing : array_like of int OR None OR False
         Array of shape ``(D,)`` corresponding to an order that the terms should be
-        calculated. If ``None``, chooses the path that reduces the number of
-        multiplications when evaluating monomials.
+        calculated by incremental monomial multiplication.
+        If ``None``, monomials are instead evaluated with a nested Horner scheme, which
+        avoids a full-grid monomial buffer and multiplies each pixel once per coefficient.
+        When `numba <https://numba.pydata.org/>`_ is installed and the grids are on the
+        CPU, this scheme runs per pixel in a parallel compiled kernel. For ``float32``
+        cupy grids, the ``polynomial`` CUDA kernel is used with an optimized path.
+        When the stack ``N`` is at least as large as the number of terms, the monomials
+        are instead computed once and summed for all stacks with one matrix product.
+        If ``False``, monomials are multiplied in the order given.
     out : numpy.ndarray OR cupy.ndarray
         A location where the result is stored. Use this to avoid allocating new memory.
 
@@ -1686,9 +2207,9 @@ def polynomial(grid, weights, terms=None, pathing=None, out=None):
         Result of the sum.
     """
     # Parse terms
-    terms = np.array(terms)
     if terms is None:
-        terms = _inverse_cantor_pairing(np.arange(D))
+        terms = _inverse_cantor_pairing(np.arange(len(weights)))
+    terms = np.array(terms)
 
     if terms.ndim == 1:
         terms = _inverse_cantor_pairing(terms)
@@ -1713,28 +2234,42 @@ def polynomial(grid, weights, terms=None, pathing=None, out=None):
 
     (D, N) = weights.shape
 
-    # Parse pathing
-    if pathing is False:
-        pathing = np.arange(terms.shape[0])
-    if pathing is None:
-        pathing = _term_pathing(terms)
-
     # Prepare the grids and canvas.
     (x_grid, y_grid) = _process_grid(grid)
     out = _parse_out(x_grid, out, stack=N)
 
+    xp = _get_module(x_grid)
     out.fill(0)
     nx0 = ny0 = 0
-    if cp == np:
-        xp = np
-        monomial = np.ones_like(x_grid)
-    else:
-        xp = cp.get_array_module(x_grid)
-        monomial = xp.ones_like(x_grid)
 
     # Force datatype for easier multiplication.
     weights = weights.astype(out.dtype)
 
+    # Parse pathing. By default, monomials are summed with Horner's scheme and only the
+    # special terms are left for the loop below.
+    if pathing is False:
+        pathing = np.arange(terms.shape[0])
+    if pathing is None:
+        special = terms[:, 0] < 0
+        monomials = np.logical_not(special)
+        if N > 1 and N >= np.sum(monomials) and out.flags.c_contiguous:
+            _polynomial_matmul(x_grid, y_grid, terms[monomials, :], weights[monomials, :], out)
+        elif (
+            _polynomial_kernel is not None and xp is not np
+            and out.dtype == np.float32 and out.flags.c_contiguous
+        ):
+            _polynomial_cuda(x_grid, y_grid, terms[monomials, :], weights[monomials, :], out)
+        elif _polynomial_numba_kernel is not None and xp is np and out.flags.c_contiguous:
+            _polynomial_numba(x_grid, y_grid, terms[monomials, :], weights[monomials, :], out)
+        else:
+            _polynomial_horner(x_grid, y_grid, terms[monomials, :], weights[monomials, :], out)
+        pathing = np.arange(D)[special]
+    else:
+        pathing = np.array(pathing, dtype=int)
+
+    if np.any(terms[pathing, 0] >= 0):
+        monomial = xp.ones_like(x_grid)
+
     # Sum the result.
     for index in pathing:
         (nx, ny) = terms[index, :]
@@ -1819,7 +2354,387 @@ def _determine_source_radius(grid, w=None):
     return np.min([np.amax(x_grid), np.amax(y_grid)]) / 4
 
 
-def laguerre_gaussian(grid, l, p=0, w=None):
+@functools.lru_cache(maxsize=128)
+def _laguerre_coefficients(p, l):
+    r"""
+    Returns the coefficients of the generalized Laguerre polynomial :math:`L_p^{l}(x)`
+    in increasing power of :math:`x`,
+
+    .. math:: L_p^{l}(x) = \sum_{k=0}^p \frac{(-1)^k}{k!} \binom{p + l}{p - k} x^k.
+    """
+    coefficients = np.array(
+        [(-1) ** k * comb(p + l, p - k) / factorial(k) for k in range(p + 1)],
+        dtype=float
+    )
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+@functools.lru_cache(maxsize=128)
+def _hermite_coefficients(n):
+    r"""
+    Returns the coefficients of the (physicists') Hermite polynomial :math:`H_n(x)`
+    in increasing power of :math:`x`,
+
+    .. math:: H_n(x) = n! \sum_{k=0}^{\lfloor n/2 \rfloor} \frac{(-1)^k}{k!(n - 2k)!} (2x)^{n - 2k}.
+    """
+    coefficients = np.zeros(n + 1)
+    for k in range(n // 2 + 1):
+        coefficients[n - 2 * k] = (
+            (-1) ** k * (factorial(n) // (factorial(k) * factorial(n - 2 * k))) * 2 ** (n - 2 * k)
+        )
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+@functools.lru_cache(maxsize=128)
+def _laguerre_roots(p, l):
+    r"""Returns the (increasing) roots of :math:`L_p^{l}(x)`."""
+    roots = np.sort(special.roots_genlaguerre(p, l)[0])
+    roots.flags.writeable = False
+    return roots
+
+
+@functools.lru_cache(maxsize=128)
+def _hermite_roots(n):
+    r"""Returns the (increasing) roots of :math:`H_n(x)`."""
+    roots = np.sort(special.roots_hermite(n)[0])
+    roots.flags.writeable = False
+    return roots
+
+
+def _separable_axes(x_grid, y_grid):
+    """
+    Returns copies of the axes ``(x_grid[:1, :], y_grid[:, :1])`` if the grids are an
+    ``xy``-indexed meshgrid, such that functions of a single coordinate can be computed in
+    1D and then broadcast. Returns ``None`` for any other (e.g. rotated) grids.
+    """
+    if np.ndim(x_grid) != 2 or np.shape(x_grid) != np.shape(y_grid):
+        return None
+
+    xp = _get_module(x_grid)
+    x_axis = x_grid[:1, :]
+    y_axis = y_grid[:, :1]
+
+    if bool(xp.all(x_grid == x_axis)) and bool(xp.all(y_grid == y_axis)):
+        return (x_axis.copy(), y_axis.copy())
+    else:
+        return None
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _polyval_numba_kernel(coefficients, scale, x, out):
+        """
+        Per-pixel second-order Horner scheme for :meth:`_polyval()`. The even and odd
+        coefficients form two independent Horner chains in :math:`x^2`, which halves the
+        length of the dependency chain of a single Horner scheme. ``x`` is scaled in
+        registers.
+        """
+        D = coefficients.size
+        parity = (D - 1) % 2
+
+        for g in numba.prange(x.size):
+            local_x = x[g] * scale
+            local_x2 = local_x * local_x
+
+            even = 0.0
+            for k in range(D - 1 - parity, -1, -2):
+                even = even * local_x2 + coefficients[k]
+            odd = 0.0
+            for k in range(D - 2 + parity, 0, -2):
+                odd = odd * local_x2 + coefficients[k]
+
+            out[g] = even + local_x * odd
+
+    def _horner_source(D):
+        """
+        Returns source which loads ``D`` coefficients into locals, and the Horner scheme
+        written out in full in terms of these locals and ``local_x``. Kernels built from
+        this have no inner loop over the coefficients, so the pixel loop vectorizes.
+        """
+        loads = "".join(f"    c{k} = coefficients[{k}]\n" for k in range(D))
+        horner = " + local_x * (".join(f"c{k}" for k in range(D)) + ")" * (D - 1)
+        return loads, horner
+
+    def _horner_compile(source):
+        """Compiles the function ``kernel`` defined by ``source`` with :mod:`numba`."""
+        namespace = {"numba" : numba, "pi" : np.pi}
+        exec(source, namespace)
+        return numba.njit(parallel=True, fastmath=True)(namespace["kernel"])
+
+    @functools.lru_cache(maxsize=None)
+    def _polyval_numba_specialized(D):
+        """
+        Returns a kernel with the signature of :meth:`_polyval_numba_kernel()`, generated
+        for polynomials with ``D`` coefficients by :meth:`_horner_source()`.
+        Kernels are compiled once per degree rather than per polynomial.
+        """
+        loads, horner = _horner_source(D)
+        return _horner_compile(
+            "def kernel(coefficients, scale, x, out):\n"
+            + loads +
+            "    for g in numba.prange(x.size):\n"
+            "        local_x = x[g] * scale\n"
+            f"        out[g] = {horner}\n"
+        )
+
+    @functools.lru_cache(maxsize=None)
+    def _laguerre_gaussian_numba_specialized(D):
+        """
+        Returns a kernel computing the whole :meth:`laguerre_gaussian()` phase in one pass
+        over the squared radius ``rr`` and polar angle ``theta``, generated for Laguerre
+        polynomials with ``D`` coefficients by :meth:`_horner_source()`.
+        ``theta`` is only read if ``l`` is nonzero.
+        """
+        loads, horner = _horner_source(D)
+        return _horner_compile(
+            "def kernel(coefficients, scale, l, rr, theta, out):\n"
+            + loads +
+            "    for g in numba.prange(rr.size):\n"
+            "        local_x = rr[g] * scale\n"
+            f"        value = pi if {horner} < 0 else 0.0\n"
+            "        if l != 0:\n"
+            "            value += l * theta[g]\n"
+            "        out[g] = value\n"
+        )
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _hermite_gaussian_sign_numba_kernel(hermite_x, hermite_y, out):
+        """
+        Writes :meth:`_hermite_gaussian_sign()` for the 1D factors of a separable grid
+        directly into the 2D ``out``, one row per thread.
+        """
+        for i in numba.prange(out.shape[0]):
+            local_y = hermite_y[i]
+            for j in range(out.shape[1]):
+                out[i, j] = np.pi if hermite_x[j] * local_y > 0 else 0.0
+else:
+    _polyval_numba_kernel = None
+    _polyval_numba_specialized = None
+    _laguerre_gaussian_numba_specialized = None
+    _hermite_gaussian_sign_numba_kernel = None
+
+# Arrays at least this large use _polyval_numba_specialized, which is worth its compile
+# time (once per degree), up to the largest degree it is generated for.
+_POLYVAL_SPECIALIZED_SIZE = 2 ** 16
+_POLYVAL_SPECIALIZED_DEGREE = 32
+
+# Largest degree for which the sign of a Laguerre or Hermite polynomial is reliable when
+# evaluated from its monomial coefficients, which cancel catastrophically at high degree.
+_POLYVAL_SIGN_DEGREE = {np.dtype(np.float32) : 4, np.dtype(np.float64) : 16}
+
+
+def _grid_astype(x_grid, y_grid, dtype=None):
+    """
+    Returns the grids cast to ``dtype``. The cast grids are cached against the originals,
+    such that repeated calls reuse them (along with their own cached helpers).
+    If ``dtype`` is ``None``, floating point grids are returned as-is and other (e.g.
+    integer) grids are promoted to float, as :mod:`numpy` arithmetic would.
+    """
+    if dtype is None:
+        if np.issubdtype(x_grid.dtype, np.floating):
+            return (x_grid, y_grid)
+        dtype = np.result_type(x_grid.dtype, y_grid.dtype, float)
+
+    if x_grid.dtype == dtype and y_grid.dtype == dtype:
+        return (x_grid, y_grid)
+
+    return _grid_cached(
+        x_grid, y_grid, ("astype", np.dtype(dtype).str),
+        lambda: (x_grid.astype(dtype), y_grid.astype(dtype))
+    )
+
+
+def _radius_squared(x_grid, y_grid):
+    """Returns :math:`x^2 + y^2` for the grids."""
+    if _numexpr(x_grid):
+        return _numexpr_evaluate("x * x + y * y", x_grid, y_grid)
+
+    xp = _get_module(x_grid)
+    rr_grid = xp.square(x_grid)
+    rr_grid += xp.square(y_grid)
+    return rr_grid
+
+
+def _polyval(x, coefficients, scale=1):
+    """
+    Evaluates the polynomial with ``coefficients`` in increasing power at ``scale * x``
+    with Horner's scheme, accumulating in place into a single new array. The scaled ``x``
+    is never written to memory. Uses :meth:`_polyval_numba_kernel()` (or
+    :meth:`_polyval_numba_specialized()` for large arrays) for :mod:`numpy` arrays if
+    :mod:`numba` is available.
+    """
+    if (
+        _polyval_numba_kernel is not None and isinstance(x, np.ndarray)
+        and x.dtype.kind == "f" and len(coefficients) > 1
+    ):
+        if (
+            x.size >= _POLYVAL_SPECIALIZED_SIZE
+            and len(coefficients) <= _POLYVAL_SPECIALIZED_DEGREE + 1
+        ):
+            kernel = _polyval_numba_specialized(len(coefficients))
+        else:
+            kernel = _polyval_numba_kernel
+
+        result = np.empty(x.shape, dtype=x.dtype)
+        kernel(coefficients, float(scale), np.ascontiguousarray(x).ravel(), result.ravel())
+        return result
+
+    xp = _get_module(x)
+    if scale != 1:
+        # Fold the scale into the coefficients, such that the scaled x is never written.
+        coefficients = coefficients * scale ** np.arange(len(coefficients))
+
+    result = xp.full_like(x, coefficients[-1])
+    for coefficient in coefficients[-2::-1]:
+        result *= x
+        result += coefficient
+    return result
+
+
+def _polyval_sign(x, coefficients, roots, scale=1):
+    r"""
+    Returns an array with the sign of the polynomial with ``coefficients`` in increasing
+    power at ``scale * x``, for polynomials with real, simple roots (e.g. Laguerre and
+    Hermite polynomials). Up to :attr:`_POLYVAL_SIGN_DEGREE`, this is the polynomial
+    itself from :meth:`_polyval()`. At higher degree, the sign is instead :math:`\pm 1` from
+    the parity of the number of ``roots()`` above each point, which is found with
+    ``searchsorted`` and holds to any degree, or zero for points on a root.
+    """
+    degree = len(coefficients) - 1
+    if degree <= _POLYVAL_SIGN_DEGREE.get(x.dtype, 0):
+        return _polyval(x, coefficients, scale)
+
+    xp = _get_module(x)
+    roots = xp.asarray(roots() / scale, dtype=x.dtype)
+
+    # Each root above x flips the sign relative to the leading coefficient.
+    below = xp.searchsorted(roots, x, side="left")
+    off_root = xp.searchsorted(roots, x, side="right") == below
+
+    parity = below
+    parity += int(coefficients[-1] < 0) - degree
+    parity &= 1
+
+    sign = parity.astype(x.dtype)
+    sign *= -2
+    sign += 1
+    sign *= off_root
+    return sign
+
+
+try:
+    _laguerre_gaussian_kernel = cp.RawKernel(CUDA_KERNELS, 'laguerre_gaussian')
+except:
+    _laguerre_gaussian_kernel = None
+
+
+@functools.lru_cache(maxsize=128)
+def _laguerre_coefficients_cuda(p, l):
+    """
+    Returns :meth:`_laguerre_coefficients()` as a ``float32`` device array, such that
+    repeated calls with the same mode do not copy the coefficients to the device again.
+    """
+    return cp.asarray(_laguerre_coefficients(p, l), dtype=np.float32)
+
+
+def _laguerre_gaussian_cuda(x_grid, y_grid, l, p, w):
+    """
+    Computes :meth:`laguerre_gaussian()` for ``float32`` cupy grids with the
+    ``laguerre_gaussian`` kernel in cuda.cu, which evaluates the vortex, the Laguerre
+    polynomial, and the pi steps for each pixel in registers.
+    """
+    if p == 0:
+        coefficients = cp.zeros(1, dtype=np.float32)
+        D = 0
+    else:
+        coefficients = _laguerre_coefficients_cuda(p, abs(l))
+        D = coefficients.size
+
+    X = cp.ascontiguousarray(x_grid)
+    Y = cp.ascontiguousarray(y_grid)
+    out = cp.empty(X.shape, dtype=np.float32)
+
+    WH = X.size
+    threads_per_block = int(_laguerre_gaussian_kernel.max_threads_per_block)
+    blocks = (WH + threads_per_block - 1) // threads_per_block
+
+    _laguerre_gaussian_kernel(
+        (blocks,),
+        (threads_per_block,),
+        (np.int32(WH), np.int32(D), coefficients, np.float32(l), np.float32(16 / w / w), X, Y, out)
+    )
+
+    return out
+
+
+def _quantize_phase(phase, levels):
+    r"""
+    Converts ``phase`` (in radians) to integer levels, where level :math:`k` corresponds
+    to a phase of :math:`2\pi k / \text{levels}`, modulo ``levels``. The phase is
+    rounded in place. Like :meth:`~slmsuite.hardware.slms.slm.SLM._phase2gray()`,
+    the modulo is a bitmask on the integers when ``levels`` is a power of two, and
+    no floating point modulo is needed either way.
+
+    Parameters
+    ----------
+    phase : numpy.ndarray or cupy.ndarray
+        Floating point phase. This is overwritten.
+    levels : int
+        Number of levels in :math:`2\pi`, at most :math:`2^{16}`.
+
+    Returns
+    -------
+    numpy.ndarray or cupy.ndarray
+        ``uint16`` levels in ``[0, levels)``.
+    """
+    levels = int(levels)
+    if not 1 < levels <= 2 ** 16:
+        raise ValueError("Expected between 2 and 2**16 levels. Found {}.".format(levels))
+
+    xp = _get_module(phase)
+    phase = xp.asarray(phase)
+
+    phase *= levels / (2 * np.pi)
+    xp.rint(phase, out=phase)
+
+    # Signed integers, such that negative phases wrap correctly.
+    integers = phase.astype(np.int32)
+    out = xp.empty(phase.shape, dtype=np.uint16)
+
+    if levels & (levels - 1) == 0:
+        xp.bitwise_and(integers, levels - 1, out=out, casting="unsafe")
+    else:
+        xp.mod(integers, levels, out=out, casting="unsafe")
+
+    return out
+
+
+def _laguerre_gaussian_numba(x_grid, y_grid, l, p, w):
+    """
+    Computes :meth:`laguerre_gaussian()` for large :mod:`numpy` grids with
+    :meth:`_laguerre_gaussian_numba_specialized()`, which fuses the Laguerre polynomial,
+    the pi steps, and the vortex into a single pass without temporaries.
+    """
+    coefficients = _laguerre_coefficients(p, abs(l))
+
+    rr_grid = _grid_cached(x_grid, y_grid, ("rr",), lambda: _radius_squared(x_grid, y_grid))
+    if l != 0:
+        theta_grid = _grid_cached(x_grid, y_grid, ("theta",), lambda: np.arctan2(x_grid, y_grid))
+    else:
+        theta_grid = np.zeros(1, dtype=x_grid.dtype)     # Never read.
+
+    out = np.empty(x_grid.shape, dtype=x_grid.dtype)
+    kernel = _laguerre_gaussian_numba_specialized(coefficients.size)
+    kernel(
+        coefficients, float(16 / (w * w)), float(l),
+        rr_grid.ravel(), theta_grid.ravel(), out.ravel()
+    )
+    return out
+
+
+def laguerre_gaussian(grid, l, p=0, w=None, dtype=None, quantize=None):
     r"""
     Returns the phase farfield for a
     `Laguerre-Gaussian <https://en.wikipedia.org/wiki/Gaussian_beam#Laguerre-Gaussian_modes>`_
@@ -1851,30 +2766,70 @@ def laguerre_gaussian(grid, l, p=0, w=None):
         The radial wavenumber. Should be non-negative.
     w : float OR None
         See :meth:`~slmsuite.holography.toolbox._determine_source_radius()`.
+    dtype : numpy.dtype OR None
+        Floating point type to compute the phase in, e.g. ``np.float32`` to halve the
+        memory traffic on large grids. The cast grids are cached.
+        If ``None``, uses the type of the grid.
+    quantize : int OR None
+        If an integer, returns the phase as ``uint16`` levels of :math:`2\pi/\text{quantize}`,
+        wrapped to ``[0, quantize)``, for phases that are sent directly to an integer
+        lookup table. A power of two avoids any modulo. If ``None``, returns the phase
+        in radians.
 
     Returns
     -------
     numpy.ndarray
         The phase for this function.
     """
-    (x_grid, y_grid) = _process_grid(grid)
-
+    (x_grid, y_grid) = _grid_astype(*_process_grid(grid), dtype)
+    xp = _get_module(x_grid)
     w = _determine_source_radius(grid, w)
 
-    theta_grid = np.arctan2(x_grid, y_grid)
-    rr_grid = y_grid * y_grid + x_grid * x_grid
+    # On the GPU, the whole phase is computed in a single kernel.
+    if (
+        _laguerre_gaussian_kernel is not None and xp is not np
+        and x_grid.dtype == np.float32 and (l != 0 or p != 0)
+        and p <= _POLYVAL_SIGN_DEGREE[x_grid.dtype]
+    ):
+        canvas = _laguerre_gaussian_cuda(x_grid, y_grid, l, p, w)
+        return canvas if quantize is None else _quantize_phase(canvas, quantize)
+
+    # On the CPU, large grids are computed in a single pass by numba.
+    if (
+        _laguerre_gaussian_numba_specialized is not None and xp is np
+        and x_grid.size >= _POLYVAL_SPECIALIZED_SIZE and p != 0
+        and p <= _POLYVAL_SIGN_DEGREE.get(x_grid.dtype, -1)
+    ):
+        canvas = _laguerre_gaussian_numba(x_grid, y_grid, l, p, w)
+        return canvas if quantize is None else _quantize_phase(canvas, quantize)
 
     canvas = 0
 
+    if p != 0:
+        # The squared radius and polar angle are fixed for a grid, so they are cached.
+        rr_grid = _grid_cached(x_grid, y_grid, ("rr",), lambda: _radius_squared(x_grid, y_grid))
+        laguerre = _polyval_sign(
+            rr_grid,
+            _laguerre_coefficients(p, abs(l)),
+            lambda: _laguerre_roots(p, abs(l)),
+            scale=16 / (w * w)
+        )
+
+        # heaviside(-L, 0) is L < 0; this is written back into the polynomial's buffer.
+        canvas = xp.less(laguerre, 0, out=laguerre)
+        canvas *= np.pi
     if l != 0:
+        theta_grid = _grid_cached(x_grid, y_grid, ("theta",), lambda: xp.arctan2(x_grid, y_grid))
         canvas += l * theta_grid
-    if p != 0:
-        canvas += np.pi * np.heaviside(-special.genlaguerre(p, np.abs(l))(16 * rr_grid / w / w), 0)
 
-    return canvas
+    if quantize is None:
+        return canvas
+    elif l == 0 and p == 0:
+        canvas = xp.zeros_like(x_grid)      # Quantized phases are always grid-shaped.
+    return _quantize_phase(canvas, quantize)
 
 
-def hermite_gaussian(grid, n, m, w=None):
+def hermite_gaussian(grid, n, m, w=None, dtype=None, quantize=None):
     r"""
     Returns the phase farfield for a
     `Hermite-Gaussian <https://en.wikipedia.org/wiki/Gaussian_beam#Hermite-Gaussian_modes>`_
@@ -1892,27 +2847,132 @@ def hermite_gaussian(grid, n, m, w=None):
         phase and a Gaussian beam.
     w : float
         See :meth:`~slmsuite.holography.toolbox._determine_source_radius()`.
+    dtype : numpy.dtype OR None
+        Floating point type to compute the phase in, e.g. ``np.float32`` to halve the
+        memory traffic on large grids. The cast grids are cached.
+        If ``None``, uses the type of the grid.
+    quantize : int OR None
+        If an integer, returns the phase as ``uint16`` levels of :math:`2\pi/\text{quantize}`,
+        wrapped to ``[0, quantize)``, for phases that are sent directly to an integer
+        lookup table. A power of two avoids any modulo. If ``None``, returns the phase
+        in radians.
 
     Returns
     -------
     numpy.ndarray
         The phase for this function.
     """
-    (x_grid, y_grid) = _process_grid(grid)
+    (x_grid, y_grid) = _grid_astype(*_process_grid(grid), dtype)
+    xp = _get_module(x_grid)
+
+    # H_0 = 1 is positive everywhere, so the phase is flat.
+    if n == 0 and m == 0:
+        canvas = xp.full_like(x_grid, np.pi)
+        return canvas if quantize is None else _quantize_phase(canvas, quantize)
+
     w = _determine_source_radius(grid, w)
 
     # factor = np.sqrt(2) / w
     factor = 4 / w
 
-    # Generate the amplitude of a Hermite-Gaussian mode.
-    phase = special.hermite(n)(factor * x_grid) * special.hermite(m)(factor * y_grid)
+    # Generate the amplitude of a Hermite-Gaussian mode, one factor per axis.
+    (x_axis, y_axis) = _hermite_axes(x_grid, y_grid)
+    hermite_x = _polyval_sign(
+        x_axis, _hermite_coefficients(n), lambda: _hermite_roots(n), scale=factor
+    )
+    hermite_y = _polyval_sign(
+        y_axis, _hermite_coefficients(m), lambda: _hermite_roots(m), scale=factor
+    )
+
+    canvas = _hermite_gaussian_sign(hermite_x, hermite_y, xp.empty_like(x_grid))
+    return canvas if quantize is None else _quantize_phase(canvas, quantize)
+
+
+def hermite_gaussian_batch(grid, nm_pairs, w=None, dtype=None):
+    r"""
+    Returns a stack of :meth:`hermite_gaussian()` phases for many modes on the same grid.
+    Each distinct horizontal order ``n`` and vertical order ``m`` is only evaluated once.
+
+    Parameters
+    ----------
+    grid : (array_like, array_like) OR :class:`~slmsuite.hardware.slms.slm.SLM`
+        Meshgrids of normalized :math:`\frac{x}{\lambda}` coordinates
+        corresponding to SLM pixels, in ``(x_grid, y_grid)`` form.
+        These are precalculated and stored in any :class:`~slmsuite.hardware.slms.slm.SLM`, so
+        such a class can be passed instead of the grids directly.
+    nm_pairs : array_like of int
+        The ``(n, m)`` wavenumbers of each of the ``K`` modes, of shape ``(K, 2)``.
+    w : float
+        See :meth:`~slmsuite.holography.toolbox._determine_source_radius()`.
+    dtype : numpy.dtype OR None
+        See :meth:`hermite_gaussian()`.
 
-    # This is real, so the phase is just the sign of the mode. This produces a
-    # checkerboard pattern. Probably could make this faster by bitflipping rows and columns.
-    phase[phase < 0] = 0
-    phase[phase > 0] = np.pi
+    Returns
+    -------
+    numpy.ndarray
+        The ``(K, H, W)`` stack of phases.
+    """
+    (x_grid, y_grid) = _grid_astype(*_process_grid(grid), dtype)
+    xp = _get_module(x_grid)
+    w = _determine_source_radius(grid, w)
+    factor = 4 / w
 
-    return phase
+    nm_pairs = np.reshape(np.array(nm_pairs, dtype=int), (-1, 2))
+
+    # Evaluate each distinct order once per axis.
+    (x_axis, y_axis) = _hermite_axes(x_grid, y_grid)
+    hermite_x = {
+        n : _polyval_sign(
+            x_axis, _hermite_coefficients(n), lambda: _hermite_roots(n), scale=factor
+        )
+        for n in np.unique(nm_pairs[:, 0])
+    }
+    hermite_y = {
+        m : _polyval_sign(
+            y_axis, _hermite_coefficients(m), lambda: _hermite_roots(m), scale=factor
+        )
+        for m in np.unique(nm_pairs[:, 1])
+    }
+
+    out = xp.empty((len(nm_pairs),) + x_grid.shape, dtype=x_grid.dtype)
+    for k, (n, m) in enumerate(nm_pairs):
+        _hermite_gaussian_sign(hermite_x[n], hermite_y[m], out[k])
+
+    return out
+
+
+def _hermite_axes(x_grid, y_grid):
+    """
+    Returns the (cached) :meth:`_separable_axes()` of the grids if they are a meshgrid,
+    such that each Hermite factor only needs to be computed along its axis.
+    Otherwise returns the grids.
+    """
+    axes = _grid_cached(x_grid, y_grid, ("axes",), lambda: _separable_axes(x_grid, y_grid))
+    return (x_grid, y_grid) if axes is None else axes
+
+
+def _hermite_gaussian_sign(hermite_x, hermite_y, out):
+    """
+    Writes the phase of the Hermite-Gaussian mode with factors ``hermite_x`` and
+    ``hermite_y`` into ``out``. This is real, so the phase is just the sign of the mode: pi
+    where the mode is positive and zero elsewhere. This produces a checkerboard pattern.
+    The sign of the product is the XOR of the signs of the factors, so the product is
+    never formed.
+    """
+    xp = _get_module(out)
+
+    if (
+        _hermite_gaussian_sign_numba_kernel is not None and xp is np and out.ndim == 2
+        and hermite_x.shape == (1, out.shape[1]) and hermite_y.shape == (out.shape[0], 1)
+    ):
+        _hermite_gaussian_sign_numba_kernel(hermite_x.ravel(), hermite_y.ravel(), out)
+        return out
+
+    positive = xp.less(hermite_x, 0) ^ xp.greater(hermite_y, 0)     # Broadcasts to 2D.
+    positive &= hermite_x != 0
+    positive &= hermite_y != 0
+
+    return xp.multiply(positive, np.pi, out=out)
 
 
 def ince_gaussian(grid, p, m, parity=1, ellipticity=1, w=None):
@@ -1953,9 +3013,6 @@ def ince_gaussian(grid, p, m, parity=1, ellipticity=1, w=None):
     numpy.ndarray
         The phase for this function.
     """
-    (x_grid, y_grid) = _process_grid(grid)
-    w = _determine_source_radius(grid, w)
-
     if parity == 1:
         if not 0 <= m <= p:
             raise ValueError("{} is an invalid Ince polynomial.".format((p,m)))
@@ -1963,12 +3020,6 @@ def ince_gaussian(grid, p, m, parity=1, ellipticity=1, w=None):
         if not 1 <= m <= p:
             raise ValueError("{} is an invalid Ince polynomial.".format((p,m)))
 
-    complex_grid = x_grid + 1j * y_grid
-
-    factor = 1 / (w * np.sqrt(ellipticity / 2))
-
-    elliptic_grid = np.arccosh(complex_grid * factor)
-
     raise NotImplementedError()
 
 
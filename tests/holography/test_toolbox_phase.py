@@ -75,6 +75,14 @@ def test_blaze(simple_grid, subtests, benchmark):
         phase_2d = phase.blaze(simple_grid, vector=(0.1, 0.2))
         assert not np.allclose(phase_3d, phase_2d)
 
+    with subtests.test("integer grids are promoted to float"):
+        int_grid = np.meshgrid(np.arange(-8, 8), np.arange(-8, 8))
+        float_grid = (int_grid[0].astype(float), int_grid[1].astype(float))
+        for vector in [(.1, .2, .3), (.1, 0, .3), (0, 0, .3)]:
+            result = phase.blaze(int_grid, vector)
+            assert result.dtype == np.float64
+            assert np.allclose(result, phase.blaze(float_grid, vector))
+
     with subtests.test("larger vector produces steeper gradient"):
         blaze_small = phase.blaze(simple_grid, vector=(0.01, 0.01))
         blaze_large = phase.blaze(simple_grid, vector=(0.1, 0.1))
@@ -208,12 +216,32 @@ def test_lens(simple_grid, subtests, benchmark):
         expected = (np.pi / 100) * np.square(simple_grid[1])
         assert np.allclose(result, expected)
 
+    with subtests.test("x-only cylindrical lens"):
+        result = phase.lens(simple_grid, f=(100, np.inf))
+        expected = (np.pi / 100) * np.square(simple_grid[0])
+        assert np.allclose(result, expected)
+
     with subtests.test("scalar focal length"):
         result = phase.lens(simple_grid, f=50)
         expected = (np.pi / 50) * (np.square(simple_grid[0]) + np.square(simple_grid[1]))
         assert np.allclose(result, expected)
 
 
+def test_numexpr_integer_grid(monkeypatch):
+    """Test that numexpr promotes integer grids to float, like numpy."""
+    pytest.importorskip("numexpr")
+    int_grid = np.meshgrid(np.arange(3), np.arange(2))
+
+    results = [phase.blaze(int_grid, (.9, .2)), phase.lens(int_grid, (10, 20))]
+
+    monkeypatch.setattr(phase, "numexpr", None)
+    expected = [phase.blaze(int_grid, (.9, .2)), phase.lens(int_grid, (10, 20))]
+
+    for result, expect in zip(results, expected):
+        assert np.issubdtype(result.dtype, np.floating)
+        assert np.allclose(result, expect)
+
+
 def test_axicon(simple_grid, normalized_grid, subtests):
     """Test axicon() phase pattern generation."""
     with subtests.test("infinite focal length gives constant"):
@@ -243,6 +271,14 @@ def test_axicon(simple_grid, normalized_grid, subtests):
         expected = (2 * np.pi * angle) * np.abs(simple_grid[0])
         assert np.allclose(result, expected)
 
+    with subtests.test("integer grids are promoted to float"):
+        int_grid = np.meshgrid(np.arange(-8, 8), np.arange(-8, 8))
+        float_grid = (int_grid[0].astype(float), int_grid[1].astype(float))
+        for f in [(np.inf, 5), (5, np.inf), (5, 10)]:
+            result = phase.axicon(int_grid, f, w=2.0)
+            assert result.dtype == np.float64
+            assert np.allclose(result, phase.axicon(float_grid, f, w=2.0))
+
     with subtests.test("both finite gives sqrt form"):
         result = phase.axicon(simple_grid, f=(100, 200), w=5.0)
         assert result.shape == simple_grid[0].shape
@@ -469,6 +505,12 @@ def test_zernike_convert_index(subtests):
         assert result.shape == (1, 2)
         assert isinstance(result[0, 0], (int, np.integer))
 
+    with subtests.test("ansi -> radial is exact for large indices"):
+        indices = np.arange(200000)
+        radial = phase.zernike_convert_index(indices, from_index="ansi", to_index="radial")
+        back = phase.zernike_convert_index(radial, from_index="radial", to_index="ansi")
+        np.testing.assert_array_equal(back.ravel(), indices)
+
     with subtests.test("list of indices"):
         result = phase.zernike_convert_index([3, 4, 5], from_index="ansi", to_index="radial")
         assert result.shape == (3, 2)
@@ -554,6 +596,13 @@ def test_zernike_sum(normalized_grid, subtests, benchmark):
         # Should have non-zero values everywhere (defocus is nonzero at corners)
         assert not np.allclose(result, 0)
 
+    with subtests.test("assume_normalized uses the grid directly"):
+        x = np.linspace(-.7, .7, 64)
+        grid = np.meshgrid(x, x)
+        result = phase.zernike_sum(grid, indices=[4, 7], weights=[1, .5], assume_normalized=True)
+        expected = phase.zernike_sum(grid, indices=[4, 7], weights=[1, .5], aperture=1, use_mask=False)
+        assert np.allclose(result, expected)
+
     with subtests.test("derivative (1,0) of tilt-x is constant"):
         # Z_2 = x, so d/dx = 1 (up to scaling)
         result = phase.zernike_sum(
@@ -564,6 +613,15 @@ def test_zernike_sum(normalized_grid, subtests, benchmark):
         assert np.std(result) < 1e-10
         assert not np.allclose(result, 0)
 
+    with subtests.test("derivative (2,0) of several indices"):
+        # Z_4 = 2r^2 - 1 and Z_12 = 6r^4 - 6r^2 + 1 (up to scaling)
+        x, y = np.meshgrid(np.linspace(-.7, .7, 16), np.linspace(-.7, .7, 16))
+        result = phase.zernike_sum(
+            (x, y), indices=[4, 12], weights=[1, 1],
+            aperture=1, use_mask=False, derivative=(2, 0)
+        )
+        assert np.allclose(result, 72 * x**2 + 24 * y**2 - 8)
+
     with subtests.test("stacked weights (D, N) returns 3D"):
         weights_2d = np.array([[1, 0], [0, 1]])  # Two polynomials, two stacks
         result = phase.zernike_sum(
@@ -580,6 +638,28 @@ def test_zernike_sum(normalized_grid, subtests, benchmark):
         # result should share memory with out
         assert np.shares_memory(result, out)
 
+    with subtests.test("cached grid helpers follow in-place grid changes"):
+        x_grid = normalized_grid[0].copy()
+        y_grid = normalized_grid[1].copy()
+        before = phase.zernike_sum((x_grid, y_grid), [4], [1], aperture=1/500)
+        x_grid *= 2
+        after = phase.zernike_sum((x_grid, y_grid), [4], [1], aperture=1/500)
+        expected = phase.zernike_sum((x_grid.copy(), y_grid.copy()), [4], [1], aperture=1/500)
+        assert not np.allclose(before, after)
+        assert np.allclose(after, expected)
+
+    with subtests.test("cached grid helpers are released with the grid"):
+        import gc
+        x_grid = normalized_grid[0].copy()
+        y_grid = normalized_grid[1].copy()
+        gc.collect()
+        before = len(phase._grid_cache)
+        phase.zernike_sum((x_grid, y_grid), [4], [1], aperture=(1/500, 1), use_mask=False)
+        assert len(phase._grid_cache) == before + 1
+        del x_grid, y_grid
+        gc.collect()
+        assert len(phase._grid_cache) == before
+
     with subtests.test("produces valid array"):
         indices = [0, 1, 2]
         weights = [1, 0.5, 0.3]
@@ -686,6 +766,13 @@ def test_polynomial(simple_grid, subtests):
         expected = simple_grid[0]**2 + simple_grid[1]**2
         assert np.allclose(result, expected)
 
+    with subtests.test("Horner evaluation matches monomial pathing"):
+        terms = np.array([[0, 0], [3, 1], [1, 3], [2, 0], [0, 4], [3, 1]])
+        weights = np.array([[1.0, -2.0], [0.5, 0.0], [-1.5, 1.0], [2.0, 3.0], [0.25, -1.0], [1.0, 1.0]])
+        horner = phase.polynomial(simple_grid, weights=weights, terms=terms)
+        ordered = phase.polynomial(simple_grid, weights=weights, terms=terms, pathing=False)
+        assert np.allclose(horner, ordered)
+
     with subtests.test("bad terms shape raises"):
         with pytest.raises(ValueError, match="Terms must be"):
             phase.polynomial(simple_grid, weights=[1.0],
@@ -732,6 +819,80 @@ def test_polynomial(simple_grid, subtests):
         assert np.shares_memory(result, out)
 
 
+def test_polynomial_numba(simple_grid, monkeypatch):
+    """The numba per-pixel Horner kernel matches the numpy Horner scheme."""
+    pytest.importorskip("numba")
+    assert phase._polynomial_numba_kernel is not None
+
+    terms = np.array([[0, 0], [3, 1], [1, 3], [2, 0], [0, 4], [5, 2], [-1, 0]])
+    weights = np.array([
+        [1.0, -2.0], [0.5, 0.0], [-1.5, 1.0], [2.0, 3.0], [0.25, -1.0], [1e-3, 0.0], [1.0, 2.0]
+    ])
+    # Non-contiguous grids are copied for the kernel.
+    strided_grid = (simple_grid[0][::2, ::3], simple_grid[1][::2, ::3])
+
+    for grid in (simple_grid, strided_grid):
+        for w in (weights[:, :1], weights):
+            result = phase.polynomial(grid, weights=w, terms=terms)
+            with monkeypatch.context() as m:
+                m.setattr(phase, "_polynomial_numba_kernel", None)
+                expected = phase.polynomial(grid, weights=w, terms=terms)
+            assert np.allclose(result, expected)
+
+
+def test_polyval_numba(monkeypatch):
+    """The generic numba second-order Horner kernel matches the numpy Horner scheme."""
+    pytest.importorskip("numba")
+    assert phase._polyval_numba_kernel is not None
+    rng = np.random.default_rng(0)
+
+    # Small arrays, and large arrays above the specialized degree, use the generic kernel.
+    cases = [(1000, D) for D in (1, 2, 3, 6, 7)]
+    cases += [(phase._POLYVAL_SPECIALIZED_SIZE, phase._POLYVAL_SPECIALIZED_DEGREE + 2)]
+
+    for (size, D) in cases:
+        coefficients = rng.normal(size=D)
+        for dtype in (np.float64, np.float32):
+            x = rng.uniform(-1.2, 1.2, size).astype(dtype)
+            result = phase._polyval(x, coefficients, scale=.9)
+            with monkeypatch.context() as m:
+                m.setattr(phase, "_polyval_numba_kernel", None)
+                expected = phase._polyval(x, coefficients, scale=.9)
+            tolerance = 1e-10 if dtype == np.float64 else 1e-4
+            assert result.dtype == dtype
+            assert np.allclose(result, expected, rtol=tolerance, atol=tolerance)
+
+
+def test_polyval_numba_specialized(monkeypatch):
+    """The generated, degree-specialized numba kernels match the numpy Horner scheme."""
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(1)
+    size = phase._POLYVAL_SPECIALIZED_SIZE
+
+    generated = []
+    specialized = phase._polyval_numba_specialized
+    monkeypatch.setattr(
+        phase, "_polyval_numba_specialized", lambda D: generated.append(D) or specialized(D)
+    )
+
+    degrees = (1, 2, 7, phase._POLYVAL_SPECIALIZED_DEGREE)
+    for degree in degrees:
+        coefficients = rng.normal(size=degree + 1)
+        for dtype in (np.float64, np.float32):
+            x = rng.uniform(-1.2, 1.2, size).astype(dtype)
+            result = phase._polyval(x, coefficients, scale=.9)
+            with monkeypatch.context() as m:
+                m.setattr(phase, "_polyval_numba_kernel", None)
+                expected = phase._polyval(x, coefficients, scale=.9)
+            tolerance = 1e-10 if dtype == np.float64 else 1e-4
+            assert result.dtype == dtype
+            assert np.allclose(result, expected, rtol=tolerance, atol=tolerance)
+
+    # Smaller arrays use the generic kernel.
+    phase._polyval(np.zeros(size - 1), coefficients)
+    assert generated == [degree + 1 for degree in degrees for _ in range(2)]
+
+
 def test_laguerre_gaussian(simple_grid, subtests):
     """Test laguerre_gaussian() structured light generation."""
     with subtests.test("l=0, p=0 gives zero (scalar)"):
@@ -765,6 +926,80 @@ def test_laguerre_gaussian(simple_grid, subtests):
         unique_extra = np.unique(np.round(result_p1 - result_p0, 4))
         assert len(unique_extra) > 1
 
+    with subtests.test("matches scipy Laguerre polynomial"):
+        from scipy import special
+        w = 3.0
+        rr = simple_grid[0]**2 + simple_grid[1]**2
+        result = phase.laguerre_gaussian(simple_grid, l=2, p=3, w=w)
+        expected = (
+            2 * np.arctan2(simple_grid[0], simple_grid[1])
+            + np.pi * np.heaviside(-special.genlaguerre(3, 2)(16 * rr / w / w), 0)
+        )
+        assert np.allclose(result, expected)
+
+    with subtests.test("large grids match scipy Laguerre polynomial"):
+        from scipy import special
+        x = np.linspace(-10, 10, 256)
+        large_grid = np.meshgrid(x, x)
+        rr = large_grid[0]**2 + large_grid[1]**2
+        for l in (0, -2):
+            result = phase.laguerre_gaussian(large_grid, l=l, p=5, w=4.0)
+            expected = (
+                l * np.arctan2(large_grid[0], large_grid[1])
+                + np.pi * (special.eval_genlaguerre(5, abs(l), rr) < 0)
+            )
+            assert np.allclose(result, expected)
+
+    with subtests.test("l=0 skips the polar angle"):
+        x_grid = simple_grid[0].copy()
+        y_grid = simple_grid[1].copy()
+        result = phase.laguerre_gaussian((x_grid, y_grid), l=0, p=2)
+        assert set(np.unique(result)) <= {0, np.pi}
+        entries = [e for k, e in phase._grid_cache.items() if k[0] == id(x_grid)]
+        assert len(entries) == 1 and ("theta",) not in entries[0]
+
+    with subtests.test("high radial order matches scipy Laguerre polynomial"):
+        from scipy import special
+        w = 1.5
+        rr = simple_grid[0]**2 + simple_grid[1]**2
+        for (p, dtype) in [(40, None), (10, np.float32)]:
+            result = phase.laguerre_gaussian(simple_grid, l=3, p=p, w=w, dtype=dtype)
+            expected = (
+                3 * np.arctan2(simple_grid[0], simple_grid[1])
+                + np.pi * (special.eval_genlaguerre(p, 3, 16 * rr / w / w) < 0)
+            )
+            assert np.mean(~np.isclose(result, expected, atol=1e-4)) < 1e-3
+
+    with subtests.test("dtype computes in single precision"):
+        result = phase.laguerre_gaussian(simple_grid, l=2, p=3, w=3.0, dtype=np.float32)
+        expected = phase.laguerre_gaussian(simple_grid, l=2, p=3, w=3.0)
+        assert result.dtype == np.float32
+        assert np.allclose(result, expected, atol=1e-5)
+
+    with subtests.test("quantize wraps to integer levels"):
+        result = phase.laguerre_gaussian(simple_grid, l=-3, p=2, w=3.0)
+        for levels in (256, 100):
+            expected = np.mod(np.rint(result * (levels / (2 * np.pi))), levels)
+            quantized = phase.laguerre_gaussian(simple_grid, l=-3, p=2, w=3.0, quantize=levels)
+            assert quantized.dtype == np.uint16
+            assert np.array_equal(quantized, expected)
+        quantized = phase.hermite_gaussian(simple_grid, n=3, m=2, w=3.0, quantize=256)
+        assert set(np.unique(quantized)) == {0, 128}
+        quantized = phase.laguerre_gaussian(simple_grid, l=0, p=0, quantize=256)
+        assert quantized.dtype == np.uint16
+        assert quantized.shape == simple_grid[0].shape and not np.any(quantized)
+        with pytest.raises(ValueError):
+            phase.laguerre_gaussian(simple_grid, l=1, quantize=1)
+
+    with subtests.test("integer grids are promoted to float"):
+        int_grid = np.meshgrid(np.arange(-3, 4), np.arange(-2, 3))
+        float_grid = (int_grid[0].astype(float), int_grid[1].astype(float))
+        result = phase.laguerre_gaussian(int_grid, l=1, p=2, w=2.0)
+        assert result.dtype == np.float64
+        assert np.allclose(result, phase.laguerre_gaussian(float_grid, l=1, p=2, w=2.0))
+        result = phase.hermite_gaussian(int_grid, n=1, m=2, w=2.0)
+        assert np.array_equal(result, phase.hermite_gaussian(float_grid, n=1, m=2, w=2.0))
+
     with subtests.test("custom w parameter"):
         result_default = phase.laguerre_gaussian(simple_grid, l=1, p=1)
         result_custom = phase.laguerre_gaussian(simple_grid, l=1, p=1, w=2.0)
@@ -787,7 +1022,8 @@ def test_hermite_gaussian(simple_grid, subtests):
         result = phase.hermite_gaussian(simple_grid, n=0, m=0)
         assert result.shape == simple_grid[0].shape
         # HG_00 Hermite is constant positive, so phase should be pi everywhere
-        assert np.allclose(result, np.pi) or np.allclose(result, 0)
+        assert np.allclose(result, np.pi)
+        assert result.dtype == simple_grid[0].dtype
 
     with subtests.test("n=1, m=0 has checkerboard in x"):
         result = phase.hermite_gaussian(simple_grid, n=1, m=0)
@@ -822,16 +1058,125 @@ def test_hermite_gaussian(simple_grid, subtests):
         result_custom = phase.hermite_gaussian(wide_grid, n=2, m=0, w=3.0)
         assert not np.allclose(result_default, result_custom)
 
+    with subtests.test("matches scipy Hermite polynomials"):
+        from scipy import special
+        factor = 4 / 3.0
+        result = phase.hermite_gaussian(simple_grid, n=3, m=2, w=3.0)
+        amplitude = (
+            special.hermite(3)(factor * simple_grid[0]) * special.hermite(2)(factor * simple_grid[1])
+        )
+        assert np.allclose(result, np.where(amplitude > 0, np.pi, 0))
+
+    with subtests.test("rotated grid is not treated as separable"):
+        from scipy import special
+        c, s = np.cos(.3), np.sin(.3)
+        x, y = simple_grid
+        rotated_grid = (c * x - s * y, s * x + c * y)
+        assert phase._separable_axes(*rotated_grid) is None
+        assert phase._separable_axes(*simple_grid) is not None
+        factor = 4 / 3.0
+        result = phase.hermite_gaussian(rotated_grid, n=3, m=2, w=3.0)
+        amplitude = (
+            special.hermite(3)(factor * rotated_grid[0]) * special.hermite(2)(factor * rotated_grid[1])
+        )
+        assert np.allclose(result, np.where(amplitude > 0, np.pi, 0))
+
+    with subtests.test("high order matches scipy Hermite polynomials"):
+        from scipy import special
+        factor = 4 / 2.5
+        result = phase.hermite_gaussian(simple_grid, n=80, m=1, w=2.5)
+        amplitude = (
+            special.eval_hermite(80, factor * simple_grid[0])
+            * special.eval_hermite(1, factor * simple_grid[1])
+        )
+        assert np.allclose(result, np.where(amplitude > 0, np.pi, 0))
+
+    with subtests.test("nodes have zero phase at any order"):
+        x = np.linspace(-4, 4, 81)
+        node_grid = np.meshgrid(x, x)
+        for n in (3, 17, 25):
+            result = phase.hermite_gaussian(node_grid, n=n, m=2, w=4.0)
+            assert not np.any(result[:, 40])
+            assert np.allclose(result[:, 39] + result[:, 41], np.pi)
+
     with subtests.test("w=None uses default"):
         result = phase.hermite_gaussian(simple_grid, n=1, m=1, w=None)
         assert result.shape == simple_grid[0].shape
 
+    with subtests.test("Hermite coefficients are exact to high order"):
+        from numpy.polynomial import hermite
+        for n in range(32):
+            basis = np.zeros(n + 1)
+            basis[n] = 1
+            expected = hermite.herm2poly(basis)
+            assert np.allclose(phase._hermite_coefficients(n), expected, rtol=1e-14, atol=0)
+        assert phase._hermite_coefficients(31) is phase._hermite_coefficients(31)
+
+    with subtests.test("batch matches individual modes"):
+        pairs = [(0, 0), (1, 2), (3, 2), (1, 0)]
+        result = phase.hermite_gaussian_batch(simple_grid, pairs, w=3.0)
+        assert result.shape == (len(pairs),) + simple_grid[0].shape
+        for k, (n, m) in enumerate(pairs):
+            assert np.array_equal(result[k], phase.hermite_gaussian(simple_grid, n, m, w=3.0))
+
+    with subtests.test("sign tail matches np.where of the product"):
+        hermite_x = np.array([[-2.0, 0.0, 1.5, 3.0]])
+        hermite_y = np.array([[1.0], [0.0], [-0.5]])
+        for (hx, hy) in [(hermite_x, hermite_y), np.broadcast_arrays(hermite_x, hermite_y)]:
+            out = phase._hermite_gaussian_sign(hx, hy, np.empty((3, 4)))
+            assert np.array_equal(out, np.where(hx * hy > 0, np.pi, 0))
+
     with subtests.test("n=2, m=2 produces multi-region pattern"):
         result = phase.hermite_gaussian(simple_grid, n=2, m=2, w=None)
         unique = np.unique(result)
         assert len(unique) == 2
 
 
+def test_structured_light_numba(monkeypatch):
+    """The fused numba Laguerre-Gaussian and Hermite sign kernels match the numpy paths."""
+    pytest.importorskip("numba")
+    x = np.linspace(-10, 10, 256)
+    grid = np.meshgrid(x, x)
+    assert grid[0].size >= phase._POLYVAL_SPECIALIZED_SIZE
+
+    fused = []
+    specialized = phase._laguerre_gaussian_numba_specialized
+    monkeypatch.setattr(
+        phase, "_laguerre_gaussian_numba_specialized",
+        lambda D: fused.append(D) or specialized(D)
+    )
+
+    # Orders up to the sign limit are fused; the last of each dtype is not.
+    cases = [(np.float64, l, p) for (l, p) in [(0, 1), (2, 3), (-1, 16), (1, 17)]]
+    cases += [(np.float32, l, p) for (l, p) in [(2, 3), (-2, 4), (1, 5)]]
+    for (dtype, l, p) in cases:
+        result = phase.laguerre_gaussian(grid, l=l, p=p, w=2.0, dtype=dtype)
+        with monkeypatch.context() as m:
+            m.setattr(phase, "_laguerre_gaussian_numba_specialized", None)
+            expected = phase.laguerre_gaussian(grid, l=l, p=p, w=2.0, dtype=dtype)
+        assert result.dtype == dtype
+        # Pixels next to a Laguerre root may round to the other side of the pi step.
+        assert np.mean(~np.isclose(result, expected, atol=1e-4)) < 1e-3
+    assert fused == [2, 4, 17, 4, 5]
+
+    signs = []
+    kernel = phase._hermite_gaussian_sign_numba_kernel
+    monkeypatch.setattr(
+        phase, "_hermite_gaussian_sign_numba_kernel",
+        lambda *args: signs.append(1) or kernel(*args)
+    )
+
+    pairs = [(0, 0), (1, 0), (3, 2), (20, 5)]
+    result = phase.hermite_gaussian_batch(grid, pairs, w=2.0)
+    with monkeypatch.context() as m:
+        m.setattr(phase, "_hermite_gaussian_sign_numba_kernel", None)
+        expected = phase.hermite_gaussian_batch(grid, pairs, w=2.0)
+        expected_single = phase.hermite_gaussian(grid, 3, 2, w=2.0)
+    assert np.array_equal(result, expected)
+    assert np.array_equal(phase.hermite_gaussian(grid, 3, 2, w=2.0), expected_single)
+    assert len(signs) == len(pairs) + 1
+
+
 def test_ince_gaussian(simple_grid, subtests):
     """Test ince_gaussian() parameter validation and NotImplementedError."""
     with subtests.test("valid parameters raises NotImplementedError"):
@@ -953,6 +1298,12 @@ def test_cantor_pairing(subtests):
         assert _cantor_pairing([[1, 0]]) == 1
         assert _cantor_pairing([[0, 1]]) == 2
 
+    with subtests.test("exact roundtrip for large indices"):
+        z = np.arange(10**6 - 1000, 10**6)
+        np.testing.assert_array_equal(_cantor_pairing(_inverse_cantor_pairing(z)), z)
+        xy = np.array([[2**30, 5]])
+        np.testing.assert_array_equal(_inverse_cantor_pairing(_cantor_pairing(xy)), xy)
+
     with subtests.test("inverse with negative index"):
         result = _inverse_cantor_pairing(np.array([-1, 0, 1]))
         assert result[0, 0] == -1
@@ -1040,6 +1391,13 @@ def test_zernike_build_and_coefficients(subtests):
         assert (0, 0) in coeffs
         assert coeffs[(0, 0)] == 1
 
+    with subtests.test("coefficients match known polynomials"):
+        # Z_4^0 = 6r^4 - 6r^2 + 1 (ANSI 12), Z_3^-3 = 3x^2y - y^3 (ANSI 6).
+        assert _zernike_coefficients(12) == {
+            (4, 0): 6, (2, 2): 12, (0, 4): 6, (2, 0): -6, (0, 2): -6, (0, 0): 1
+        }
+        assert _zernike_coefficients(6) == {(2, 1): 3, (0, 3): -1}
+
 
 def test_zernike_populate_basis_map(subtests):
     """Test _zernike_populate_basis_map()."""
@@ -1099,3 +1457,49 @@ def test_zernike_sum_gpu(benchmark, has_cupy):
 
     result = benchmark(run)
     assert grid[0].shape == (256, 256)
+
+
+@pytest.mark.gpu
+def test_zernike_sum_masked_gpu(has_cupy, monkeypatch):
+    """The fused masked CUDA kernel matches the gathered masked path."""
+    import cupy as cp
+
+    x = cp.linspace(-1, 1, 256, dtype=cp.float32)
+    grid = cp.meshgrid(x, x)
+    rng = np.random.default_rng(42)
+
+    for indices in (list(range(10)), [-1, 3, 4, 7]):
+        weights = rng.normal(0, 0.1, len(indices))
+        for use_mask in (True, np.nan):
+            fused = phase.zernike_sum(
+                grid, indices, weights, aperture="circular", use_mask=use_mask
+            )
+            with monkeypatch.context() as m:
+                m.setattr(phase, "_polynomial_masked_kernel", None)
+                expected = phase.zernike_sum(
+                    grid, indices, weights, aperture="circular", use_mask=use_mask
+                )
+            assert fused.dtype == cp.float32
+            assert cp.allclose(fused, expected, atol=1e-5, equal_nan=True)
+
+
+@pytest.mark.gpu
+def test_laguerre_gaussian_gpu(has_cupy, monkeypatch):
+    """The laguerre_gaussian CUDA kernel matches the array path at float32 tolerance."""
+    import cupy as cp
+
+    x = np.linspace(-10, 10, 256, dtype=np.float32)
+    grid = np.meshgrid(x, x)
+    grid_gpu = (cp.asarray(grid[0]), cp.asarray(grid[1]))
+
+    for (l, p) in [(1, 0), (-3, 0), (0, 2), (2, 3), (-1, 4)]:
+        result = phase.laguerre_gaussian(grid_gpu, l=l, p=p, w=3.0)
+        with monkeypatch.context() as m:
+            m.setattr(phase, "_laguerre_gaussian_kernel", None)
+            expected_gpu = phase.laguerre_gaussian(grid_gpu, l=l, p=p, w=3.0)
+        expected = phase.laguerre_gaussian(grid, l=l, p=p, w=3.0)
+
+        assert result.dtype == cp.float32
+        for reference in (cp.asnumpy(expected_gpu), expected):
+            # Pixels next to a Laguerre root may round to the other side of the pi step.
+            assert np.mean(~np.isclose(cp.asnumpy(result), reference, atol=1e-4)) < 1e-3